@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from typing import Iterator
 
 import click
 
@@ -10,7 +12,14 @@ from sublingo import __version__
 from sublingo.services.translation_service import PROVIDERS
 from sublingo.utils.config import build_config
 from sublingo.utils.file_utils import VIDEO_EXTENSIONS, SUBTITLE_EXTENSIONS
-from sublingo.utils.logger import setup_logging
+from sublingo.utils.logger import get_logger, setup_logging
+
+logger = get_logger(__name__)
+
+# Lower-cased extensions without the dot, matched against bare file names
+_VALID_EXTENSIONS = frozenset(
+    ext.lstrip(".").lower() for ext in SUBTITLE_EXTENSIONS | VIDEO_EXTENSIONS
+)
 
 
 def _is_already_translated(path: Path, target_lang: str) -> bool:
@@ -27,24 +36,49 @@ def _is_already_translated(path: Path, target_lang: str) -> bool:
     return False
 
 
+def _walk(root: Path, recursive: bool = False) -> Iterator[os.DirEntry[str]]:
+    """Yield file entries under root using os.scandir.
+
+    Like Path.glob("**/*"), symlinked directories are not descended into
+    and unreadable subdirectories are skipped.
+    """
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.is_file():
+                        yield entry
+                    elif recursive and entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError:
+            if directory == str(root):
+                raise
+            logger.debug("Skipping unreadable directory: %s", directory)
+
+
 def _collect_files(
     input_path: Path,
     recursive: bool = False,
     target_lang: str | None = None,
 ) -> list[Path]:
     """Collect translatable files from a path (file or directory)."""
-    valid_extensions = SUBTITLE_EXTENSIONS | VIDEO_EXTENSIONS
     if input_path.is_file():
         return [input_path]
     if input_path.is_dir():
-        pattern = "**/*" if recursive else "*"
-        files = sorted(
-            f for f in input_path.glob(pattern)
-            if f.is_file()
-            and f.suffix.lower() in valid_extensions
-            and not (target_lang and _is_already_translated(f, target_lang))
-        )
-        return files
+        files = []
+        for entry in _walk(input_path, recursive):
+            # Filter on the bare name before paying for a Path object
+            # (an empty stem means a dotfile like ".srt", which has no suffix)
+            stem, _, ext = entry.name.rpartition(".")
+            if not stem or ext.lower() not in _VALID_EXTENSIONS:
+                continue
+            path = Path(entry.path)
+            if target_lang and _is_already_translated(path, target_lang):
+                continue
+            files.append(path)
+        return sorted(files)
     return []
 
 
@@ -65,6 +99,8 @@ def cli() -> None:
 @click.option("--output", "-o", type=click.Path(path_type=Path), default=None, help="Output file path")
 @click.option("--output-format", default=None, help="Output format (srt, vtt, ass)")
 @click.option("--batch-size", type=int, default=None, help="Entries per translation batch")
+@click.option("--batch-chars", type=click.IntRange(min=1), default=None, help="Pack batches up to this many characters (--batch-size becomes the max entries)")
+@click.option("--concurrency", type=click.IntRange(min=1), default=None, help="Batches translated in parallel (default: 1)")
 @click.option("--temperature", type=float, default=None, help="LLM temperature")
 @click.option("--timeout", type=float, default=None, help="LLM API timeout in seconds (default: 120)")
 @click.option("--retries", type=int, default=None, help="Max retry attempts per batch (default: 10)")
@@ -72,6 +108,7 @@ def cli() -> None:
 @click.option("--keep-names", is_flag=True, default=False, help="Keep personal and place names untranslated")
 @click.option("-r", "--recursive", is_flag=True, default=False, help="Recursively scan subdirectories")
 @click.option("--overwrite", is_flag=True, default=False, help="Re-translate even if output file exists")
+@click.option("--no-cache", is_flag=True, default=False, help="Don't read or write the translation and TVDB caches")
 @click.option("-v", "--verbose", is_flag=True, default=False, help="Verbose output")
 @click.option("--debug", is_flag=True, default=False, help="Debug mode: print raw LLM responses")
 def translate(
@@ -85,6 +122,8 @@ def translate(
     output: Path | None,
     output_format: str | None,
     batch_size: int | None,
+    batch_chars: int | None,
+    concurrency: int | None,
     temperature: float | None,
     timeout: float | None,
     retries: int | None,
@@ -92,6 +131,7 @@ def translate(
     keep_names: bool,
     recursive: bool,
     overwrite: bool,
+    no_cache: bool,
     verbose: bool,
     debug: bool,
 ) -> None:
@@ -107,11 +147,14 @@ def translate(
         "api_key": api_key,
         "output_format": output_format,
         "batch_size": batch_size,
+        "batch_chars": batch_chars,
+        "concurrency": concurrency,
         "temperature": temperature,
         "timeout": timeout,
         "retries": retries,
         "bilingual": bilingual,
         "keep_names": keep_names,
+        "cache": False if no_cache else None,
         "debug": debug,
         "verbose": verbose,
     }
@@ -138,15 +181,37 @@ def translate(
         )
 
     import threading
+    from concurrent.futures import Future, ThreadPoolExecutor
     from sublingo.services.translation_service import (
-        translate_file, _cleanup_temp_files, _quit_listener, _cancel_event,
-        TranslationSkipped,
+        translate_file, extract_video_subtitles, _cleanup_temp_files,
+        _quit_listener, _cancel_event, TranslationSkipped,
     )
-    from sublingo.utils.file_utils import generate_output_path
+    from sublingo.utils.file_utils import generate_output_path, is_video_file
+
+    def existing_output(file: Path) -> Path | None:
+        """Return the output path if it already exists and should be kept."""
+        if overwrite or output:
+            return None
+        expected_output = generate_output_path(
+            file, config["target_language"], config.get("output_format"),
+        )
+        return expected_output if expected_output.exists() else None
+
+    # Extract the next video's subtitles while the current file translates
+    extract_pool = ThreadPoolExecutor(max_workers=1)
+    prefetched: dict[Path, Future[Path]] = {}
+
+    def prefetch_next(start: int) -> None:
+        nxt = next((f for f in files[start:] if existing_output(f) is None), None)
+        if nxt is not None and is_video_file(nxt) and nxt not in prefetched:
+            prefetched[nxt] = extract_pool.submit(
+                extract_video_subtitles, nxt, config.get("debug", False),
+            )
 
     # Start key listener once for the whole session
     _cancel_event.clear()
-    listener = threading.Thread(target=_quit_listener, daemon=True)
+    listener_stop = threading.Event()
+    listener = threading.Thread(target=_quit_listener, args=(listener_stop,), daemon=True)
     listener.start()
 
     click.echo(f"Found {len(files)} file(s) to translate")
@@ -156,20 +221,20 @@ def translate(
     try:
         for i, file in enumerate(files, 1):
             # Check if output already exists
-            if not overwrite and not output:
-                expected_output = generate_output_path(
-                    file, config["target_language"], config.get("output_format"),
-                )
-                if expected_output.exists():
-                    skipped += 1
-                    if len(files) > 1:
-                        click.echo(f"[{i}/{len(files)}] Skipped (exists): {expected_output}")
-                    continue
+            expected_output = existing_output(file)
+            if expected_output is not None:
+                skipped += 1
+                if len(files) > 1:
+                    click.echo(f"[{i}/{len(files)}] Skipped (exists): {expected_output}")
+                continue
 
             if len(files) > 1:
                 click.echo(f"\n[{i}/{len(files)}] {file.name}")
+            prefetch_next(i)
             try:
-                out = translate_file(file, config, output_path=output)
+                pending = prefetched.pop(file, None)
+                subtitle_path = pending.result() if pending else None
+                out = translate_file(file, config, output_path=output, subtitle_path=subtitle_path)
                 click.echo(f"Translated: {out}")
             except TranslationSkipped:
                 click.echo(f"Skipped: {file.name}")
@@ -181,9 +246,18 @@ def translate(
                 if len(files) == 1:
                     raise click.ClickException(str(e))
     except KeyboardInterrupt:
+        # Let a running background extraction finish so its file is removed too
+        extract_pool.shutdown(wait=True, cancel_futures=True)
         _cleanup_temp_files()
         click.echo("\nStopped.")
         return
+    finally:
+        extract_pool.shutdown(wait=False, cancel_futures=True)
+        # Stop the key listener so it restores the terminal settings; its
+        # own event, so _cancel_event isn't left set for later callers
+        listener_stop.set()
+        listener.join(timeout=1.0)
+        _cancel_event.clear()
 
     if skipped:
         click.echo(f"\nSkipped {skipped} file(s) (already translated)")
@@ -203,16 +277,18 @@ def list_languages() -> None:
     from sublingo.utils.languages import list_languages
 
     langs = list_languages()
-    click.echo("Supported language codes:")
-    for code, name in sorted(langs.items()):
-        click.echo(f"  {code:<8} {name}")
+    lines = ["Supported language codes:"]
+    lines.extend(f"  {code:<8} {name}" for code, name in sorted(langs.items()))
+    click.echo("\n".join(lines))
 
 
 @cli.command()
 def config() -> None:
     """Show current configuration."""
     cfg = build_config()
+    lines = []
     for key, val in sorted(cfg.items()):
         if key == "api_key" and val:
             val = val[:4] + "..." + val[-4:] if len(val) > 8 else "***"
-        click.echo(f"  {key}: {val}")
+        lines.append(f"  {key}: {val}")
+    click.echo("\n".join(lines))
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Callable
+
 from sublingo.core.subtitle_parser import SubtitleEntry
 
 
@@ -16,3 +18,35 @@ def create_batches(
         entries[i : i + batch_size]
         for i in range(0, len(entries), batch_size)
     ]
+
+
+def create_batches_by_budget(
+    entries: list[SubtitleEntry],
+    max_chars: int = 8000,
+    max_entries: int = 50,
+    measure: Callable[[str], int] = len,
+) -> list[list[SubtitleEntry]]:
+    """Greedily pack entries into batches bounded by text size.
+
+    A batch is closed when adding the next entry would reach max_chars
+    (as counted by measure, e.g. a tokenizer's token count) or when it
+    already holds max_entries. An entry larger than the budget gets a
+    batch of its own.
+    """
+    if max_chars < 1:
+        raise ValueError("max_chars must be at least 1")
+    if max_entries < 1:
+        raise ValueError("max_entries must be at least 1")
+    batches: list[list[SubtitleEntry]] = []
+    current: list[SubtitleEntry] = []
+    used = 0
+    for entry in entries:
+        size = measure(entry.text)
+        if current and (used + size >= max_chars or len(current) >= max_entries):
+            batches.append(current)
+            current, used = [], 0
+        current.append(entry)
+        used += size
+    if current:
+        batches.append(current)
+    return batches
@@ -22,8 +22,12 @@ def extract_subtitles(
     if output_path is None:
         output_path = video_path.with_suffix(".srt")
 
+    # -nostdin keeps ffmpeg from consuming the s/q key presses
     cmd = [
         "ffmpeg",
+        "-nostdin",
+        "-hide_banner",
+        "-loglevel", "error",
         "-y",
         "-i", str(video_path),
         "-map", f"0:s:{stream_index}",
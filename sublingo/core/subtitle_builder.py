@@ -3,12 +3,79 @@
 from __future__ import annotations
 
 from pathlib import Path
+from types import TracebackType
 
 import pysubs2
 
 from sublingo.core.subtitle_parser import SubtitleEntry
 
 
+class SubtitleBuilder:
+    """Collect subtitle entries and write them to a file once, on close().
+
+    The original file (if any) is loaded a single time up front so its
+    styles/metadata are preserved no matter how many times entries are
+    added. Use as a context manager; the file is written when the block
+    exits without an exception.
+    """
+
+    def __init__(self, output_path: Path, original_path: Path | None = None):
+        self.output_path = output_path
+        self.output_format = output_path.suffix.lstrip(".")
+        # SRT carries no styles or metadata, so there is nothing to preserve
+        if original_path and original_path.suffix.lower() != ".srt" and original_path.is_file():
+            self._subs = pysubs2.load(str(original_path))
+            self._subs.events.clear()
+        else:
+            self._subs = pysubs2.SSAFile()
+
+    def add_entries(
+        self,
+        entries: list[SubtitleEntry],
+        bilingual: bool = False,
+        original_entries: list[SubtitleEntry] | None = None,
+    ) -> None:
+        """Append entries to the output.
+
+        If bilingual=True and original_entries provided, each subtitle line
+        will contain the original text followed by the translated text.
+        original_entries is matched to entries by position.
+        """
+        for i, entry in enumerate(entries):
+            text = entry.text
+            if bilingual and original_entries and i < len(original_entries):
+                text = f"{original_entries[i].text}\\N{entry.text}"
+
+            event = pysubs2.SSAEvent(
+                start=entry.start,
+                end=entry.end,
+                text=text,
+                style=entry.style,
+            )
+            self._subs.events.append(event)
+
+    def close(self) -> None:
+        """Write all added entries to output_path."""
+        self._subs.save(str(self.output_path), format_=self.output_format)
+
+    def __enter__(self) -> SubtitleBuilder:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+
+
+def open_builder(output_path: Path, original_path: Path | None = None) -> SubtitleBuilder:
+    """Start an incremental subtitle write; see SubtitleBuilder."""
+    return SubtitleBuilder(output_path, original_path)
+
+
 def build_file(
     entries: list[SubtitleEntry],
     output_path: Path,
@@ -16,31 +83,10 @@ def build_file(
     bilingual: bool = False,
     original_entries: list[SubtitleEntry] | None = None,
 ) -> None:
-    """Write subtitle entries to a file.
+    """Write subtitle entries to a file in one go.
 
     If bilingual=True and original_entries provided, each subtitle line
     will contain the original text followed by the translated text.
     """
-    # If we have an original file, load it to preserve styles/metadata
-    if original_path and original_path.is_file():
-        subs = pysubs2.load(str(original_path))
-        subs.events.clear()
-    else:
-        subs = pysubs2.SSAFile()
-
-    for i, entry in enumerate(entries):
-        text = entry.text
-        if bilingual and original_entries and i < len(original_entries):
-            text = f"{original_entries[i].text}\\N{entry.text}"
-
-        event = pysubs2.SSAEvent(
-            start=entry.start,
-            end=entry.end,
-            text=text,
-            style=entry.style,
-        )
-        subs.events.append(event)
-
-    # Determine output format from extension
-    output_format = output_path.suffix.lstrip(".")
-    subs.save(str(output_path), format_=output_format)
+    with open_builder(output_path, original_path) as builder:
+        builder.add_entries(entries, bilingual=bilingual, original_entries=original_entries)
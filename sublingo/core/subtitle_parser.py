@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import io
+import re
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Iterable
 
 import pysubs2
 
 
-@dataclass
+@dataclass(slots=True)
 class SubtitleEntry:
     index: int
     start: int  # milliseconds
@@ -17,9 +20,78 @@ class SubtitleEntry:
     style: str = "Default"
 
 
-def parse_file(path: Path) -> list[SubtitleEntry]:
-    """Parse a subtitle file into a list of SubtitleEntry."""
-    subs = pysubs2.load(str(path))
+# Same cleanup pysubs2 applies to SRT text before SSAEvent.plaintext
+_HTML_TAG_RE = re.compile(r"< */? *[a-zA-Z][^>]*>")
+_OVERRIDE_TAG_RE = re.compile(r"{[^}]*}")
+_NEXT_INDEX_RE = re.compile(r"\n+ *\d+ *$")
+
+
+def _srt_timestamp_to_ms(stamp: str) -> int | None:
+    """Convert 'HH:MM:SS,mmm' (or '.mmm') to milliseconds, None if malformed."""
+    hms, sep, frac = stamp.replace(".", ",").partition(",")
+    parts = hms.split(":")
+    if (
+        not sep
+        or len(parts) != 3
+        or not all(p.isdigit() and len(p) <= 2 for p in parts)
+        or not (frac.isdigit() and len(frac) <= 3)
+    ):
+        return None
+    h, m, s = map(int, parts)
+    return ((h * 60 + m) * 60 + s) * 1000 + int(frac) * 10 ** (3 - len(frac))
+
+
+def _srt_cue_text(lines: list[str]) -> str:
+    """Join the lines following a timing line into plain text."""
+    # Empty cue: blank line(s) followed directly by the next cue number
+    if len(lines) >= 2 and not "".join(lines[:-1]).strip() and lines[-1].strip().isdigit():
+        return ""
+    text = "".join(lines).strip()
+    text = _NEXT_INDEX_RE.sub("", text)
+    if "<" in text:
+        text = _HTML_TAG_RE.sub("", text)
+    if "{" in text:
+        text = _OVERRIDE_TAG_RE.sub("", text)
+    if "\\" in text:
+        text = text.replace(r"\h", " ").replace(r"\n", "\n").replace(r"\N", "\n")
+    return text
+
+
+def _parse_srt_lines(lines: Iterable[str]) -> list[SubtitleEntry] | None:
+    """Single-pass SRT parser producing SubtitleEntry objects directly.
+
+    Returns None when the input doesn't look like plain SRT so the caller can
+    fall back to pysubs2.
+    """
+    cues: list[tuple[int, int, list[str]]] = []
+    seen_content = False
+    for line in lines:
+        if not seen_content and line.strip():
+            seen_content = True
+            if line.lstrip("\ufeff").lstrip().startswith("WEBVTT"):
+                return None
+        if line.startswith("[Script Info]") or line.startswith("[V4+ Styles]"):
+            return None
+        if "-->" in line:
+            start_part, _, end_part = line.partition("-->")
+            end_tokens = end_part.split()
+            start = _srt_timestamp_to_ms(start_part.strip())
+            end = _srt_timestamp_to_ms(end_tokens[0]) if end_tokens else None
+            if start is None or end is None:
+                return None
+            cues.append((start, end, []))
+        elif cues:
+            cues[-1][2].append(line)
+
+    if not cues:
+        return None
+    return [
+        SubtitleEntry(index=i, start=start, end=end, text=_srt_cue_text(text_lines))
+        for i, (start, end, text_lines) in enumerate(cues)
+    ]
+
+
+def _entries_from_subs(subs: pysubs2.SSAFile) -> list[SubtitleEntry]:
     entries = []
     for i, event in enumerate(subs.events):
         if event.is_comment:
@@ -36,20 +108,24 @@ def parse_file(path: Path) -> list[SubtitleEntry]:
     return entries
 
 
+def parse_file(path: Path) -> list[SubtitleEntry]:
+    """Parse a subtitle file into a list of SubtitleEntry.
+
+    SRT files go through a lightweight line-based parser; everything else
+    (and any SRT file it can't handle) is loaded with pysubs2.
+    """
+    if path.suffix.lower() == ".srt":
+        with open(path, encoding="utf-8") as f:
+            entries = _parse_srt_lines(f)
+        if entries is not None:
+            return entries
+    return _entries_from_subs(pysubs2.load(str(path)))
+
+
 def parse_string(content: str, format: str = "srt") -> list[SubtitleEntry]:
     """Parse subtitle content from a string."""
-    subs = pysubs2.SSAFile.from_string(content, format_=format)
-    entries = []
-    for i, event in enumerate(subs.events):
-        if event.is_comment:
-            continue
-        entries.append(
-            SubtitleEntry(
-                index=i,
-                start=event.start,
-                end=event.end,
-                text=event.plaintext,
-                style=event.style,
-            )
-        )
-    return entries
+    if format == "srt":
+        entries = _parse_srt_lines(io.StringIO(content, newline=None))
+        if entries is not None:
+            return entries
+    return _entries_from_subs(pysubs2.SSAFile.from_string(content, format_=format))
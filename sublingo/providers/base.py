@@ -3,13 +3,17 @@
 from __future__ import annotations
 
 import concurrent.futures
+import functools
 import json
 import re
 import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable
 
+import httpx
+
+from sublingo.utils import json_utils
 from sublingo.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -20,83 +24,182 @@ USER_PROMPT_FILE = PROMPTS_DIR / "user_prompt.txt"
 KEEP_NAMES_RULE_FILE = PROMPTS_DIR / "keep_names_rule.txt"
 
 
+@functools.lru_cache(maxsize=None)
+def _load_template(path: Path) -> str:
+    """Read a prompt template file once and keep it for the rest of the process."""
+    return path.read_text(encoding="utf-8")
+
+
+def _reload_templates() -> None:
+    """Drop cached templates so edited prompt files are picked up again."""
+    _load_template.cache_clear()
+    _render_static_prompts.cache_clear()
+
+
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+
 def _replace_placeholders(template: str, replacements: dict[str, str]) -> str:
     """Replace {placeholder} tokens in a template string.
 
-    Uses str.replace() instead of str.format() so that literal braces
-    (e.g. JSON examples like {"index": 1}) don't cause errors.
+    Uses a single regex pass instead of str.format() so that literal braces
+    (e.g. JSON examples like {"index": 1}) and unknown names are left as-is.
+    Substituted values are not scanned again.
     """
-    result = template
-    for key, value in replacements.items():
-        result = result.replace("{" + key + "}", value)
-    return result
+    return _PLACEHOLDER_RE.sub(
+        lambda m: replacements.get(m.group(1), m.group(0)), template,
+    )
 
 
-def build_prompts(
+@functools.lru_cache(maxsize=32)
+def _render_static_prompts(
     source_lang: str,
     target_lang: str,
-    entries_json: str,
-    keep_names: bool = False,
-    tvdb_context: str | None = None,
-) -> tuple[str, str]:
-    """Build both system and user prompts from template files.
+    keep_names: bool,
+    tvdb_context: str | None,
+) -> tuple[str, tuple[str, ...]]:
+    """Render everything in the prompts except the entries JSON.
 
-    Returns (system_prompt, user_prompt).
+    Returns the system prompt and the user prompt split around its
+    {entries_json} placeholder. Both only change per file, not per batch.
     """
-    keep_names_rule = KEEP_NAMES_RULE_FILE.read_text(encoding="utf-8") if keep_names else ""
+    keep_names_rule = _load_template(KEEP_NAMES_RULE_FILE) if keep_names else ""
     replacements = {
         "keep_names_rule": keep_names_rule,
         "tvdb_context": tvdb_context or "",
         "source_lang": source_lang,
         "target_lang": target_lang,
-        "entries_json": entries_json,
     }
-    system_template = SYSTEM_PROMPT_FILE.read_text(encoding="utf-8")
-    user_template = USER_PROMPT_FILE.read_text(encoding="utf-8")
+    system_template = _load_template(SYSTEM_PROMPT_FILE)
+    user_template = _load_template(USER_PROMPT_FILE)
     return (
         _replace_placeholders(system_template, replacements),
-        _replace_placeholders(user_template, replacements),
+        tuple(
+            _replace_placeholders(part, replacements)
+            for part in user_template.split("{entries_json}")
+        ),
     )
 
-DEFAULT_RETRIES = 10
 
+def build_prompts(
+    source_lang: str,
+    target_lang: str,
+    entries_json: str,
+    keep_names: bool = False,
+    tvdb_context: str | None = None,
+) -> tuple[str, str]:
+    """Build both system and user prompts from template files.
 
-def format_entries_for_prompt(entries: list[dict[str, Any]]) -> str:
-    return json.dumps(entries, ensure_ascii=False, indent=2)
+    Returns (system_prompt, user_prompt).
+    """
+    system_prompt, user_parts = _render_static_prompts(
+        source_lang, target_lang, keep_names, tvdb_context,
+    )
+    return system_prompt, entries_json.join(user_parts)
+
+
+DEFAULT_RETRIES = 10
+DEFAULT_CONCURRENCY = 1
+REPAIR_PROMPT_SUFFIX = (
+    "\nPREVIOUS RESPONSE WAS MALFORMED JSON. "
+    "RETURN ONLY the JSON array, no prose, no fences."
+)
+REPAIR_USER_SUFFIX = "\n\nRespond ONLY with the JSON array, no prose."
+INTERRUPT_POLL_INTERVAL = 0.05  # seconds between cancel/skip checks
+
+_JSON_DECODER = json.JSONDecoder()
+_FENCE_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?```", re.DOTALL)
+# Text with no letters at all (blank, numbers, punctuation, "♪") is never sent
+_PASSTHROUGH_RE = re.compile(r"[\W\d_]*")
+
+
+def format_entries_for_prompt(
+    entries: list[dict[str, Any]],
+    compact: bool = True,
+) -> str:
+    """Serialize entries for the prompt.
+
+    Compact JSON keeps the prompt (and token count) small; compact=False
+    indents it, which providers do in --debug mode so the logged prompts
+    stay readable.
+    """
+    return json_utils.dumps(entries, indent=not compact)
 
 
 def extract_json_array(text: str) -> list[dict[str, Any]]:
     """Extract a JSON array from LLM response text, handling markdown fences."""
-    # Try direct parse first
-    text = text.strip()
+    if "[" not in text:
+        raise ValueError(f"No JSON array in response: {text[:200]}")
+
+    # Fast path: the response starts with the array. raw_decode stops at the
+    # closing bracket, so trailing whitespace or chatter doesn't matter.
+    if not text.startswith("["):
+        text = text.lstrip()
     if text.startswith("["):
         try:
-            return json.loads(text)
-        except json.JSONDecodeError:
+            return json_utils.loads(text)
+        except json_utils.JSONDecodeError:
             pass
-
-    # Try extracting from markdown code fences
-    match = re.search(r"```(?:json)?\s*\n?(.*?)\n?```", text, re.DOTALL)
-    if match:
         try:
-            return json.loads(match.group(1).strip())
+            return _JSON_DECODER.raw_decode(text)[0]
         except json.JSONDecodeError:
             pass
 
-    # Try finding array in text
-    match = re.search(r"\[.*\]", text, re.DOTALL)
-    if match:
+    # Try extracting from markdown code fences
+    if "```" in text:
+        match = _FENCE_RE.search(text)
+        if match:
+            try:
+                return json_utils.loads(match.group(1).strip())
+            except json_utils.JSONDecodeError:
+                pass
+
+    # Try each bracketed span in the text
+    for candidate in json_utils.iter_balanced(text, "[", "]"):
         try:
-            return json.loads(match.group(0))
-        except json.JSONDecodeError:
-            pass
+            result = json_utils.loads(candidate)
+        except json_utils.JSONDecodeError:
+            continue
+        if isinstance(result, list):
+            return result
 
     raise ValueError(f"Could not parse JSON array from response: {text[:200]}")
 
 
+def _texts_by_index(results: list[Any]) -> dict[int, str]:
+    """Map each returned entry's index to its text, skipping malformed items."""
+    by_index: dict[int, str] = {}
+    for item in results:
+        if not isinstance(item, dict):
+            continue
+        try:
+            index = int(item["index"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        text = item.get("text")
+        if isinstance(text, str):
+            by_index[index] = text
+    return by_index
+
+
+def _raise_if_interrupted(
+    cancel_event: threading.Event | None,
+    skip_event: threading.Event | None,
+    abort_event: threading.Event | None = None,
+) -> None:
+    if cancel_event and cancel_event.is_set():
+        raise KeyboardInterrupt("Cancelled by user")
+    if skip_event and skip_event.is_set():
+        raise InterruptedError("Skipped by user")
+    if abort_event and abort_event.is_set():
+        raise RuntimeError("Aborted after another batch failed")
+
+
 class BaseLLMProvider(ABC):
     """Abstract base class for LLM translation providers."""
 
+    name: str  # provider name for display; set by each subclass
+
     def __init__(
         self,
         model: str | None = None,
@@ -110,52 +213,136 @@ class BaseLLMProvider(ABC):
         self.api_key = api_key
         self.temperature = temperature
         self.timeout = timeout
-        self._active_client: Any = None  # httpx.Client ref for cancellation
+        self._session: httpx.Client | None = None
+        self._clients_lock = threading.Lock()
+        self._interrupt_pool: concurrent.futures.ThreadPoolExecutor | None = None
+        self._request_slots: threading.BoundedSemaphore | None = None
         self.retries = DEFAULT_RETRIES
+        self.concurrency = DEFAULT_CONCURRENCY
+        # --debug: indent the entries JSON so logged prompts are readable
+        self.debug = False
 
     @abstractmethod
     def _call_api(
         self,
         system_prompt: str,
         user_prompt: str,
+        temperature: float | None = None,
     ) -> str:
-        """Make the actual API call and return the raw text response."""
+        """Make the actual API call and return the raw text response.
+
+        temperature overrides self.temperature for this call when given.
+        """
+
+    def _get_session(self) -> httpx.Client:
+        """Return the provider's pooled HTTP client, creating it on first use.
+
+        Requests share keep-alive connections instead of paying a TCP/TLS
+        handshake per batch. A closed session (after an abort) is replaced.
+        """
+        with self._clients_lock:
+            if self._session is None or self._session.is_closed:
+                self._session = httpx.Client(
+                    timeout=self.timeout,
+                    limits=httpx.Limits(
+                        max_keepalive_connections=max(8, self.concurrency),
+                        max_connections=max(16, 2 * self.concurrency),
+                    ),
+                )
+            return self._session
 
     def _abort_active_request(self) -> None:
-        """Close the active httpx client to abort an in-flight request."""
-        client = self._active_client
-        if client is not None:
+        """Close the HTTP session to abort in-flight requests."""
+        with self._clients_lock:
+            session, self._session = self._session, None
+        if session is not None:
             try:
-                client.close()
+                session.close()
             except Exception:
                 pass
 
+    def _get_interrupt_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Return the worker pool used by _call_api_interruptible, creating it on first use.
+
+        Sized to self.concurrency so translate_many() workers never queue
+        behind each other.
+        """
+        with self._clients_lock:
+            if self._interrupt_pool is None:
+                self._interrupt_pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.concurrency,
+                    thread_name_prefix=f"sublingo-{type(self).__name__}",
+                )
+            return self._interrupt_pool
+
+    def _call_api_limited(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float | None = None,
+        abort_event: threading.Event | None = None,
+    ) -> str:
+        """Call _call_api, allowing at most self.concurrency calls at once.
+
+        Keeps the provider within its request budget however many threads
+        (translate_many workers, language detection) call into it.
+        """
+        with self._clients_lock:
+            if self._request_slots is None:
+                self._request_slots = threading.BoundedSemaphore(self.concurrency)
+            slots = self._request_slots
+        with slots:
+            # A batch waiting for a slot may have been aborted meanwhile
+            _raise_if_interrupted(None, None, abort_event)
+            return self._call_api(system_prompt, user_prompt, temperature)
+
+    def close(self) -> None:
+        """Release the HTTP session and worker pool. The provider can still be used afterwards."""
+        with self._clients_lock:
+            pool, self._interrupt_pool = self._interrupt_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        self._abort_active_request()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def _call_api_interruptible(
         self,
         system_prompt: str,
         user_prompt: str,
         cancel_event: threading.Event | None = None,
         skip_event: threading.Event | None = None,
+        temperature: float | None = None,
+        abort_event: threading.Event | None = None,
     ) -> str:
-        """Run _call_api in a thread so cancel/skip events can interrupt it."""
-        if cancel_event is None and skip_event is None:
-            return self._call_api(system_prompt, user_prompt)
+        """Run _call_api in a thread so cancel/skip/abort events can interrupt it.
 
-        pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
-        future = pool.submit(self._call_api, system_prompt, user_prompt)
-        try:
-            while True:
-                try:
-                    return future.result(timeout=0.3)
-                except concurrent.futures.TimeoutError:
-                    if cancel_event and cancel_event.is_set():
-                        self._abort_active_request()
-                        raise KeyboardInterrupt("Cancelled by user")
-                    if skip_event and skip_event.is_set():
-                        self._abort_active_request()
-                        raise InterruptedError("Skipped by user")
-        finally:
-            pool.shutdown(wait=False, cancel_futures=True)
+        abort_event is set by translate_many when another batch has failed.
+        """
+        if cancel_event is None and skip_event is None and abort_event is None:
+            return self._call_api_limited(system_prompt, user_prompt, temperature)
+
+        future = self._get_interrupt_pool().submit(
+            self._call_api_limited, system_prompt, user_prompt, temperature, abort_event,
+        )
+        done = threading.Event()
+        future.add_done_callback(lambda _: done.set())
+        while not done.wait(INTERRUPT_POLL_INTERVAL):
+            # On cancel/skip the worker is left to finish on its own once
+            # the aborted request errors out; its result is discarded.
+            if cancel_event and cancel_event.is_set():
+                self._abort_active_request()
+                raise KeyboardInterrupt("Cancelled by user")
+            if skip_event and skip_event.is_set():
+                self._abort_active_request()
+                raise InterruptedError("Skipped by user")
+            # translate_many already aborted the session for this one
+            _raise_if_interrupted(None, None, abort_event)
+        return future.result()
 
     def translate(
         self,
@@ -167,6 +354,7 @@ class BaseLLMProvider(ABC):
         cancel_event: threading.Event | None = None,
         skip_event: threading.Event | None = None,
         tvdb_context: str | None = None,
+        abort_event: threading.Event | None = None,
     ) -> list[dict[str, Any]]:
         """Translate a batch of subtitle entries.
 
@@ -179,39 +367,99 @@ class BaseLLMProvider(ABC):
             cancel_event: Event to signal quit (pressed q)
             skip_event: Event to signal skip (pressed s)
             tvdb_context: Optional TVDB context string for the system prompt
+            abort_event: Event to stop retrying (set by translate_many when
+                another batch failed)
 
         Returns:
-            List of {"index": int, "text": str} dicts with translations
+            List of {"index": int, "text": str} dicts with translations, one
+            per input entry and in the same order. Entries the model did not
+            return keep their original text.
+        """
+        translated: dict[int, str] = {}
+        pending: list[dict[str, Any]] = []
+        for entry in texts:
+            if _PASSTHROUGH_RE.fullmatch(entry["text"]):
+                translated[entry["index"]] = entry["text"]
+            else:
+                pending.append(entry)
+        if translated:
+            logger.debug("Passing through %d untranslatable entries", len(translated))
+
+        if pending:
+            by_index = self._request_translation(
+                pending, source_lang, target_lang,
+                temperature=temperature,
+                keep_names=keep_names,
+                cancel_event=cancel_event,
+                skip_event=skip_event,
+                tvdb_context=tvdb_context,
+                abort_event=abort_event,
+            )
+            for entry in pending:
+                text = by_index.get(entry["index"])
+                if text is not None:
+                    translated[entry["index"]] = text
+
+        return [
+            {"index": entry["index"], "text": translated.get(entry["index"], entry["text"])}
+            for entry in texts
+        ]
+
+    def _request_translation(
+        self,
+        texts: list[dict[str, Any]],
+        source_lang: str,
+        target_lang: str,
+        temperature: float | None = None,
+        keep_names: bool = False,
+        cancel_event: threading.Event | None = None,
+        skip_event: threading.Event | None = None,
+        tvdb_context: str | None = None,
+        abort_event: threading.Event | None = None,
+    ) -> dict[int, str]:
+        """Send one batch to the LLM and return {index: translated text}.
+
+        Rather than re-sending the identical prompt, failed attempts escalate:
+        a malformed response is retried with a repair instruction at
+        temperature 0, and a response missing entries is followed up with a
+        request for just the missing ones. Up to self.retries requests are
+        made in total; entries still missing after that are left out.
+
+        Raises:
+            RuntimeError: if no attempt produced a parseable response.
         """
-        system_prompt, user_prompt = build_prompts(
-            source_lang=source_lang,
-            target_lang=target_lang,
-            entries_json=format_entries_for_prompt(texts),
-            keep_names=keep_names,
-            tvdb_context=tvdb_context,
-        )
-
-        logger.debug("System prompt:\n%s", system_prompt)
-        logger.debug("User prompt:\n%s", user_prompt)
-
         max_retries = self.retries
+        translated: dict[int, str] = {}
+        pending = texts
+        repair = False
         last_error = None
         raw = None
         for attempt in range(1, max_retries + 1):
+            _raise_if_interrupted(None, None, abort_event)
+            system_prompt, user_prompt = build_prompts(
+                source_lang=source_lang,
+                target_lang=target_lang,
+                entries_json=format_entries_for_prompt(pending, compact=not self.debug),
+                keep_names=keep_names,
+                tvdb_context=tvdb_context,
+            )
+            if repair:
+                system_prompt += REPAIR_PROMPT_SUFFIX
+                user_prompt += REPAIR_USER_SUFFIX
+            logger.debug("System prompt:\n%s", system_prompt)
+            logger.debug("User prompt:\n%s", user_prompt)
+
             try:
                 raw = self._call_api_interruptible(
                     system_prompt, user_prompt, cancel_event, skip_event,
+                    temperature=0.0 if repair else temperature,
+                    abort_event=abort_event,
                 )
                 logger.debug("LLM raw response:\n%s", raw)
                 result = extract_json_array(raw)
-                if len(result) != len(texts):
-                    logger.warning(
-                        "Expected %d entries, got %d (attempt %d)",
-                        len(texts), len(result), attempt,
-                    )
-                return result
             except (ValueError, json.JSONDecodeError, KeyError) as e:
                 last_error = e
+                repair = True
                 logger.warning(
                     "Attempt %d/%d failed to parse response: %s",
                     attempt, max_retries, e,
@@ -219,12 +467,122 @@ class BaseLLMProvider(ABC):
                 logger.warning("System prompt:\n%s", system_prompt)
                 logger.warning("User prompt:\n%s", user_prompt)
                 logger.warning("Response:\n%s", raw or "N/A")
-
+                continue
+
+            repair = False
+            by_index = _texts_by_index(result)
+            if len(result) == len(pending) and not all(e["index"] in by_index for e in pending):
+                # Model renumbered the entries but kept the count: trust positions
+                by_index = {
+                    e["index"]: r["text"] for e, r in zip(pending, result)
+                    if isinstance(r, dict) and isinstance(r.get("text"), str)
+                }
+            for entry in pending:
+                text = by_index.get(entry["index"])
+                if text is not None:
+                    translated[entry["index"]] = text
+            missing = [e for e in pending if e["index"] not in translated]
+            if not missing:
+                return translated
+            logger.warning(
+                "Expected %d entries, got %d (attempt %d); requesting the %d missing",
+                len(pending), len(pending) - len(missing), attempt, len(missing),
+            )
+            pending = missing
+
+        if translated:
+            logger.warning(
+                "Giving up on %d entries after %d attempts; keeping original text",
+                len(pending), max_retries,
+            )
+            return translated
         raise RuntimeError(
             f"Failed to get valid translation after {max_retries} attempts: {last_error}"
         )
 
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Provider name for display."""
+    def translate_many(
+        self,
+        batches: Iterable[list[dict[str, Any]]],
+        source_lang: str,
+        target_lang: str,
+        max_workers: int | None = None,
+        temperature: float | None = None,
+        keep_names: bool = False,
+        cancel_event: threading.Event | None = None,
+        skip_event: threading.Event | None = None,
+        tvdb_context: str | None = None,
+        on_result: Callable[[int, list[dict[str, Any]]], None] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """Translate several batches, running up to max_workers requests at once.
+
+        Batches are pulled from the iterable lazily, keeping at most
+        2 * max_workers of them submitted at a time.
+
+        Args:
+            batches: Iterable of batches, each a list of {"index": int, "text": str} dicts
+            max_workers: Concurrent requests (default: self.concurrency)
+            on_result: Called as on_result(batch_index, results) when a batch
+                finishes; batches may complete out of order
+            Remaining arguments are passed through to translate().
+
+        Returns:
+            One result list per batch, in the same order as batches.
+        """
+        workers = max(1, max_workers or self.concurrency)
+        kwargs: dict[str, Any] = {
+            "temperature": temperature,
+            "keep_names": keep_names,
+            "cancel_event": cancel_event,
+            "skip_event": skip_event,
+            "tvdb_context": tvdb_context,
+        }
+        results: dict[int, list[dict[str, Any]]] = {}
+
+        if workers == 1:
+            for i, texts in enumerate(batches):
+                _raise_if_interrupted(cancel_event, skip_event)
+                results[i] = self.translate(texts, source_lang, target_lang, **kwargs)
+                if on_result:
+                    on_result(i, results[i])
+            return [results[i] for i in range(len(results))]
+
+        # Tells in-flight translate() calls to stop retrying if a batch fails
+        abort_event = threading.Event()
+        kwargs["abort_event"] = abort_event
+        window = 2 * workers
+        queued = enumerate(batches)
+        in_flight: dict[concurrent.futures.Future[list[dict[str, Any]]], int] = {}
+        pool = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+
+        def fill() -> None:
+            while len(in_flight) < window:
+                item = next(queued, None)
+                if item is None:
+                    return
+                i, texts = item
+                in_flight[pool.submit(self.translate, texts, source_lang, target_lang, **kwargs)] = i
+
+        try:
+            fill()
+            while in_flight:
+                done, _ = concurrent.futures.wait(
+                    in_flight, return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                for future in done:
+                    i = in_flight.pop(future)
+                    results[i] = future.result()
+                    if on_result:
+                        on_result(i, results[i])
+                _raise_if_interrupted(cancel_event, skip_event)
+                fill()
+        except BaseException as e:
+            # One batch failed or was interrupted: drop queued batches and
+            # abort the ones still in flight.
+            if isinstance(e, KeyboardInterrupt) and cancel_event:
+                cancel_event.set()
+            abort_event.set()
+            self._abort_active_request()
+            raise
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+        return [results[i] for i in range(len(results))]
@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-import httpx
-
 from sublingo.providers.base import BaseLLMProvider
+from sublingo.utils import json_utils
 from sublingo.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -14,6 +13,8 @@ DEFAULT_MODEL = "llama3.1"
 
 
 class OllamaProvider(BaseLLMProvider):
+    name = "ollama"
+
     def __init__(
         self,
         model: str | None = None,
@@ -30,16 +31,17 @@ class OllamaProvider(BaseLLMProvider):
             timeout=timeout,
         )
 
-    @property
-    def name(self) -> str:
-        return "ollama"
-
-    def _call_api(self, system_prompt: str, user_prompt: str) -> str:
+    def _call_api(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float | None = None,
+    ) -> str:
         payload = {
             "model": self.model,
             "stream": False,
             "options": {
-                "temperature": self.temperature,
+                "temperature": self.temperature if temperature is None else temperature,
             },
             "messages": [
                 {"role": "system", "content": system_prompt},
@@ -49,16 +51,10 @@ class OllamaProvider(BaseLLMProvider):
 
         logger.debug("POST %s/api/chat model=%s", self.base_url, self.model)
 
-        client = httpx.Client(timeout=self.timeout)
-        self._active_client = client
-        try:
-            resp = client.post(
-                f"{self.base_url}/api/chat",
-                json=payload,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            return data["message"]["content"]
-        finally:
-            self._active_client = None
-            client.close()
+        resp = self._get_session().post(
+            f"{self.base_url}/api/chat",
+            json=payload,
+        )
+        resp.raise_for_status()
+        data = json_utils.loads(resp.content)
+        return data["message"]["content"]
@@ -5,6 +5,7 @@ from __future__ import annotations
 import httpx
 
 from sublingo.providers.base import BaseLLMProvider
+from sublingo.utils import json_utils
 from sublingo.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -14,6 +15,10 @@ DEFAULT_MODEL = "gpt-4o-mini"
 
 
 class OpenAIProvider(BaseLLMProvider):
+    name = "openai"
+    # Request SSE responses so reading can stop once the JSON array closes
+    stream_responses = True
+
     def __init__(
         self,
         model: str | None = None,
@@ -30,37 +35,95 @@ class OpenAIProvider(BaseLLMProvider):
             timeout=timeout,
         )
 
-    @property
-    def name(self) -> str:
-        return "openai"
-
-    def _call_api(self, system_prompt: str, user_prompt: str) -> str:
+    def _call_api(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float | None = None,
+    ) -> str:
         headers = {"Content-Type": "application/json"}
         if self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
 
         payload = {
             "model": self.model,
-            "temperature": self.temperature,
+            "temperature": self.temperature if temperature is None else temperature,
             "messages": [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt},
             ],
         }
+        if self.stream_responses:
+            payload["stream"] = True
 
         logger.debug("POST %s/chat/completions model=%s", self.base_url, self.model)
 
-        client = httpx.Client(timeout=self.timeout)
-        self._active_client = client
-        try:
-            resp = client.post(
-                f"{self.base_url}/chat/completions",
-                json=payload,
-                headers=headers,
-            )
+        with self._get_session().stream(
+            "POST",
+            f"{self.base_url}/chat/completions",
+            json=payload,
+            headers=headers,
+        ) as resp:
             resp.raise_for_status()
-            data = resp.json()
-            return data["choices"][0]["message"]["content"]
-        finally:
-            self._active_client = None
-            client.close()
+            if resp.headers.get("content-type", "").startswith("text/event-stream"):
+                return _read_event_stream(resp)
+            # Server ignored "stream" (or streaming is off): plain JSON body
+            data = json_utils.loads(resp.read())
+        return data["choices"][0]["message"]["content"]
+
+
+def _is_json_list(text: str) -> bool:
+    try:
+        return isinstance(json_utils.loads(text), list)
+    except json_utils.JSONDecodeError:
+        return False
+
+
+def _array_closed(
+    scanner: json_utils.BalancedScanner, delta: str, parts: list[str], scan_offset: int,
+) -> bool:
+    """Feed delta to scanner; True if a span closed in it is a JSON array."""
+    content = None
+    for start, end in scanner.scan(delta):
+        if content is None:
+            content = "".join(parts)
+        if _is_json_list(content[scan_offset + start:scan_offset + end + 1]):
+            return True
+    return False
+
+
+def _read_event_stream(resp: httpx.Response) -> str:
+    """Collect the content deltas of a streamed chat completion.
+
+    When the content starts with a bracket, stops reading as soon as a
+    balanced [...] span parses as a JSON array; a bracketed preface such
+    as "[Note]" is read past. Anything the model adds afterwards is skipped.
+    """
+    parts: list[str] = []
+    scanner: json_utils.BalancedScanner | None = None
+    scan_offset = 0  # position in the content of the scanner's first character
+    leading = True
+    for line in resp.iter_lines():
+        if not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if data == "[DONE]":
+            break
+        choices = json_utils.loads(data).get("choices") or []
+        delta = (choices[0].get("delta") or {}).get("content") if choices else None
+        if not delta:
+            continue
+        parts.append(delta)
+        if leading:
+            stripped = delta.lstrip()
+            if not stripped:
+                continue
+            leading = False
+            if stripped.startswith("["):
+                scanner = json_utils.BalancedScanner()
+                scan_offset = sum(map(len, parts[:-1]))
+        if scanner is not None and _array_closed(scanner, delta, parts, scan_offset):
+            logger.debug("Response JSON array complete, closing stream early")
+            break
+    return "".join(parts)
+
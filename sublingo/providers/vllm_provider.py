@@ -11,6 +11,8 @@ DEFAULT_MODEL = "default"
 class VLLMProvider(OpenAIProvider):
     """vLLM uses the OpenAI-compatible API format."""
 
+    name = "vllm"
+
     def __init__(
         self,
         model: str | None = None,
@@ -26,7 +28,3 @@ class VLLMProvider(OpenAIProvider):
             temperature=temperature,
             timeout=timeout,
         )
-
-    @property
-    def name(self) -> str:
-        return "vllm"
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import json
-import re
 import threading
 
 from sublingo.core.subtitle_parser import SubtitleEntry
 from sublingo.providers.base import BaseLLMProvider
+from sublingo.utils import json_utils
 from sublingo.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -26,6 +26,31 @@ Text:
 """
 
 MAX_RETRIES = 3
+MAX_SAMPLE_CHARS = 2000
+
+
+def _sample_text(entries: list[SubtitleEntry], sample_size: int) -> str:
+    """Join sample_size entries spread evenly across the file.
+
+    Taking only the first entries tends to pick up opening credits, which
+    are often in a different language from the dialogue. The result is
+    capped at MAX_SAMPLE_CHARS to keep the detection prompt small.
+    """
+    step = max(1, len(entries) // sample_size)
+    sample = entries[::step][:sample_size]
+    return "\n".join(e.text for e in sample)[:MAX_SAMPLE_CHARS]
+
+
+def _first_json_object(text: str) -> dict:
+    """Return the first {...} span in text that parses as a JSON object."""
+    for candidate in json_utils.iter_balanced(text, "{", "}"):
+        try:
+            result = json.loads(candidate)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(result, dict):
+            return result
+    raise ValueError("No JSON object found in response")
 
 
 def detect_language(
@@ -39,8 +64,7 @@ def detect_language(
 
     Returns dict with "language" (full name) and "code" (ISO 639-1).
     """
-    sample = entries[:sample_size]
-    sample_text = "\n".join(e.text for e in sample)
+    sample_text = _sample_text(entries, sample_size)
 
     user_prompt = DETECTION_USER_PROMPT.format(sample_text=sample_text)
     logger.debug("Detection system prompt:\n%s", DETECTION_SYSTEM_PROMPT)
@@ -60,11 +84,7 @@ def detect_language(
                 result = json.loads(raw)
             except json.JSONDecodeError:
                 # Try extracting JSON object from response
-                match = re.search(r"\{.*?\}", raw, re.DOTALL)
-                if match:
-                    result = json.loads(match.group(0))
-                else:
-                    raise ValueError(f"No JSON object found in response")
+                result = _first_json_object(raw)
 
             # Validate it has the expected keys
             if "language" not in result and "code" not in result:
@@ -0,0 +1,81 @@
+"""Persistent translation cache backed by SQLite."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+from pathlib import Path
+from typing import Iterable
+
+from sublingo.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_FILENAME = "translations.sqlite3"
+# SQLite's default limit on "?" placeholders per statement is 999
+_QUERY_CHUNK = 500
+
+
+def default_cache_dir() -> Path:
+    """Return $XDG_CACHE_HOME/sublingo, defaulting to ~/.cache/sublingo."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "sublingo"
+
+
+class TranslationCache:
+    """Translations keyed by line text plus the context they were made in.
+
+    The context is any sequence of values that affect the translation,
+    e.g. (provider, model, source_lang, target_lang, keep_names).
+    """
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS translations "
+            "(key TEXT PRIMARY KEY, text TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _key(text: str, context: Iterable[object]) -> str:
+        raw = "\x1f".join(map(str, context)) + "\x1e" + text
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def get_many(self, texts: Iterable[str], context: tuple[object, ...]) -> dict[str, str]:
+        """Return {text: translation} for the texts that are cached."""
+        by_key = {self._key(text, context): text for text in texts}
+        keys = list(by_key)
+        found: dict[str, str] = {}
+        for start in range(0, len(keys), _QUERY_CHUNK):
+            chunk = keys[start:start + _QUERY_CHUNK]
+            rows = self._conn.execute(
+                f"SELECT key, text FROM translations WHERE key IN ({','.join('?' * len(chunk))})",
+                chunk,
+            )
+            for key, translation in rows:
+                found[by_key[key]] = translation
+        return found
+
+    def put_many(self, translations: dict[str, str], context: tuple[object, ...]) -> None:
+        """Store {text: translation} pairs, replacing existing entries."""
+        if not translations:
+            return
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translations (key, text) VALUES (?, ?)",
+                ((self._key(text, context), tr) for text, tr in translations.items()),
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def open_cache(cache_dir: Path | None = None) -> TranslationCache:
+    """Open (creating if needed) the translation cache in cache_dir."""
+    path = (cache_dir or default_cache_dir()) / CACHE_FILENAME
+    logger.debug("Translation cache: %s", path)
+    return TranslationCache(path)
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import os
+import sqlite3
 import sys
 import threading
 from pathlib import Path
 from typing import Any
 
-from sublingo.core.batching import create_batches
+from sublingo.core.batching import create_batches, create_batches_by_budget
 from sublingo.core.extractor import extract_subtitles
 from sublingo.core.subtitle_builder import build_file
 from sublingo.core.subtitle_parser import SubtitleEntry, parse_file
@@ -16,6 +18,8 @@ from sublingo.providers.ollama_provider import OllamaProvider
 from sublingo.providers.openai_provider import OpenAIProvider
 from sublingo.providers.vllm_provider import VLLMProvider
 from sublingo.services.language_detection import detect_language
+from sublingo.services.translation_cache import TranslationCache, open_cache
+from sublingo.services.tvdb_cache import TVDBCache, open_tvdb_cache
 from sublingo.utils.file_utils import generate_output_path, is_video_file
 from sublingo.utils.languages import resolve_language
 from rich.progress import BarColumn, MofNCompleteColumn, Progress, TextColumn, TimeElapsedColumn, TimeRemainingColumn
@@ -27,29 +31,44 @@ logger = get_logger(__name__)
 _cancel_event = threading.Event()
 _skip_event = threading.Event()
 _temp_files: list[Path] = []
+LISTENER_POLL_INTERVAL = 0.2  # seconds between _cancel_event checks
 
 
 class TranslationSkipped(Exception):
     """Raised when user presses 's' to skip current file."""
 
 
-def _quit_listener() -> None:
-    """Background thread that listens for key presses: 'q' to quit, 's' to skip."""
+def _quit_listener(stop_event: threading.Event | None = None) -> None:
+    """Background thread that listens for key presses: 'q' to quit, 's' to skip.
+
+    Waits on stdin with a short timeout instead of blocking in read(), so
+    the thread notices _cancel_event or stop_event and restores the
+    terminal promptly. stop_event ends the listener without cancelling
+    any translation.
+    """
     try:
+        import selectors
         import tty
         import termios
         fd = sys.stdin.fileno()
         old_settings = termios.tcgetattr(fd)
+        sel = selectors.DefaultSelector()
         try:
             tty.setcbreak(fd)
-            while not _cancel_event.is_set():
-                ch = sys.stdin.read(1)
+            sel.register(fd, selectors.EVENT_READ)
+            while not _cancel_event.is_set() and not (stop_event and stop_event.is_set()):
+                if not sel.select(timeout=LISTENER_POLL_INTERVAL):
+                    continue
+                ch = os.read(fd, 1).decode(errors="ignore")
+                if not ch:  # EOF
+                    break
                 if ch.lower() == "q":
                     _cancel_event.set()
                     break
                 elif ch.lower() == "s":
                     _skip_event.set()
         finally:
+            sel.close()
             termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
     except (ImportError, OSError, ValueError):
         # Not a terminal (e.g. piped input), skip listener
@@ -65,6 +84,31 @@ def _cleanup_temp_files() -> None:
     _temp_files.clear()
 
 
+def _remove_temp_file(path: Path | None) -> None:
+    """Remove one extracted subtitle file registered in _temp_files.
+
+    Used when a single file is finished or skipped, so subtitles already
+    extracted for the next video are left alone.
+    """
+    if path is None or path not in _temp_files:
+        return
+    path.unlink(missing_ok=True)
+    _temp_files.remove(path)
+    logger.info("Cleaned up extracted subtitle: %s", path)
+
+
+def extract_video_subtitles(video_path: Path, debug: bool = False) -> Path:
+    """Extract subtitles from a video and register the file for cleanup.
+
+    Safe to run in a background thread ahead of translate_file().
+    """
+    logger.info("Extracting subtitles from video: %s", video_path)
+    sub_path = extract_subtitles(video_path)
+    if not debug:
+        _temp_files.append(sub_path)
+    return sub_path
+
+
 PROVIDERS: dict[str, type[BaseLLMProvider]] = {
     "openai": OpenAIProvider,
     "ollama": OllamaProvider,
@@ -91,21 +135,61 @@ def get_provider(config: dict[str, Any]) -> BaseLLMProvider:
     provider = provider_cls(**kwargs)
     if config.get("retries") is not None:
         provider.retries = int(config["retries"])
+    if config.get("concurrency") is not None:
+        provider.concurrency = max(1, int(config["concurrency"]))
+    provider.debug = bool(config.get("debug"))
     return provider
 
 
+def _get_translation_cache(config: dict[str, Any]) -> TranslationCache | None:
+    """Return the persistent translation cache, or None if disabled.
+
+    Opened once and stored on config so it is reused across files.
+    """
+    if not config.get("cache"):
+        return None
+    cache = config.get("_translation_cache")
+    if cache is None:
+        cache_dir = config.get("cache_dir")
+        try:
+            cache = open_cache(Path(cache_dir).expanduser() if cache_dir else None)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Translation cache unavailable: %s", e)
+            config["cache"] = False
+            return None
+        config["_translation_cache"] = cache
+    return cache
+
+
+def _get_tvdb_cache(config: dict[str, Any]) -> TVDBCache | None:
+    """Return the persistent TVDB response cache, or None if disabled."""
+    if not config.get("cache"):
+        return None
+    cache_dir = config.get("cache_dir")
+    try:
+        return open_tvdb_cache(Path(cache_dir).expanduser() if cache_dir else None)
+    except (OSError, sqlite3.Error) as e:
+        logger.warning("TVDB cache unavailable: %s", e)
+        return None
+
+
 def translate_file(
     input_path: Path,
     config: dict[str, Any],
     output_path: Path | None = None,
+    subtitle_path: Path | None = None,
 ) -> Path:
     """Translate a subtitle file end-to-end.
 
+    subtitle_path is the result of extract_video_subtitles() for a video
+    input_path that was extracted ahead of time.
+
     Returns the output file path.
     """
     target_lang = config.get("target_language", "en")
     source_lang = config.get("source_language", "auto")
     batch_size = config.get("batch_size", 20)
+    batch_chars = config.get("batch_chars")
     bilingual = config.get("bilingual", False)
     keep_names = config.get("keep_names", False)
     output_format = config.get("output_format")
@@ -115,13 +199,10 @@ def translate_file(
     # Reset events for this file
     _skip_event.clear()
 
-    # If input is a video, extract subtitles first
+    # If input is a video, extract subtitles first (unless already prefetched)
     if is_video_file(input_path):
-        logger.info("Extracting subtitles from video: %s", input_path)
-        input_path = extract_subtitles(input_path)
+        input_path = subtitle_path or extract_video_subtitles(input_path, debug=debug)
         extracted_sub_path = input_path
-        if not debug:
-            _temp_files.append(extracted_sub_path)
 
     # Parse
     logger.info("Parsing subtitles: %s", input_path)
@@ -131,115 +212,161 @@ def translate_file(
     if not entries:
         raise ValueError("No subtitle entries found in file")
 
-    # Get provider
+    # Get provider; closed (HTTP session and worker pool released) once
+    # this file's requests are done, even on skip or error
     provider = get_provider(config)
-    logger.info("Using provider: %s (model: %s)", provider.name, provider.model)
+    try:
+        logger.info("Using provider: %s (model: %s)", provider.name, provider.model)
 
-    # Resolve language codes to full names for prompts
-    target_lang_full = resolve_language(target_lang)
-    logger.info("Target language: %s -> %s", target_lang, target_lang_full)
+        # Resolve language codes to full names for prompts
+        target_lang_full = resolve_language(target_lang)
+        logger.info("Target language: %s -> %s", target_lang, target_lang_full)
 
-    # Detect source language if auto
-    source_lang_code = source_lang  # preserve original code for TVDB lookup
-    try:
-        if source_lang == "auto":
-            detected = detect_language(
-                entries, provider,
-                cancel_event=_cancel_event, skip_event=_skip_event,
+        # Detect source language if auto
+        source_lang_code = source_lang  # preserve original code for TVDB lookup
+        try:
+            if source_lang == "auto":
+                detected = detect_language(
+                    entries, provider,
+                    cancel_event=_cancel_event, skip_event=_skip_event,
+                )
+                source_lang = detected.get("language", "Unknown")
+                source_lang_code = detected.get("code", source_lang_code)
+                logger.info("Auto-detected source language: %s", source_lang)
+            else:
+                source_lang = resolve_language(source_lang)
+                logger.info("Source language: %s", source_lang)
+        except KeyboardInterrupt:
+            _cleanup_temp_files()
+            raise
+        except InterruptedError:
+            _remove_temp_file(extracted_sub_path)
+            raise TranslationSkipped()
+
+        # Build TVDB context if API key is configured
+        tvdb_context: str | None = None
+        tvdb_api_key = config.get("tvdb_api_key")
+        if tvdb_api_key:
+            try:
+                from sublingo.services.tvdb_client import TVDBClient
+                from sublingo.services.tvdb_context import build_tvdb_context
+
+                # Reuse client across files if stored on config
+                tvdb_client = config.get("_tvdb_client")
+                if tvdb_client is None:
+                    tvdb_client = TVDBClient(tvdb_api_key, cache=_get_tvdb_cache(config))
+                    config["_tvdb_client"] = tvdb_client
+                tvdb_context = build_tvdb_context(
+                    tvdb_client, input_path.name, source_lang_code, target_lang,
+                )
+                if tvdb_context:
+                    logger.info("TVDB context loaded for %s", input_path.name)
+            except Exception:
+                logger.debug("TVDB lookup failed, continuing without context", exc_info=True)
+
+        # Repeated lines are translated once and copied to every occurrence
+        positions: dict[str, list[int]] = {}  # stripped text -> positions in entries
+        unique_entries: list[SubtitleEntry] = []
+        for pos, entry in enumerate(entries):
+            slots = positions.setdefault(entry.text.strip(), [])
+            if not slots:
+                unique_entries.append(entry)
+            slots.append(pos)
+        if len(unique_entries) < len(entries):
+            logger.info(
+                "Skipping %d duplicate entries (%d unique)",
+                len(entries) - len(unique_entries), len(unique_entries),
             )
-            source_lang = detected.get("language", "Unknown")
-            source_lang_code = detected.get("code", source_lang_code)
-            logger.info("Auto-detected source language: %s", source_lang)
-        else:
-            source_lang = resolve_language(source_lang)
-            logger.info("Source language: %s", source_lang)
-    except KeyboardInterrupt:
-        _cleanup_temp_files()
-        raise
-    except InterruptedError:
-        _cleanup_temp_files()
-        raise TranslationSkipped()
 
-    # Build TVDB context if API key is configured
-    tvdb_context: str | None = None
-    tvdb_api_key = config.get("tvdb_api_key")
-    if tvdb_api_key:
-        try:
-            from sublingo.services.tvdb_client import TVDBClient
-            from sublingo.services.tvdb_context import build_tvdb_context
-
-            # Reuse client across files if stored on config
-            tvdb_client = config.get("_tvdb_client")
-            if tvdb_client is None:
-                tvdb_client = TVDBClient(tvdb_api_key)
-                config["_tvdb_client"] = tvdb_client
-            tvdb_context = build_tvdb_context(
-                tvdb_client, input_path.name, source_lang_code, target_lang,
+        # Slot for every entry, filled in as batches complete (possibly out of order)
+        translated_entries: list[SubtitleEntry | None] = [None] * len(entries)
+
+        def fill(key: str, text: str) -> int:
+            """Set the translation of every entry whose stripped text is key."""
+            for pos in positions[key]:
+                entry = entries[pos]
+                translated_entries[pos] = SubtitleEntry(
+                    index=entry.index,
+                    start=entry.start,
+                    end=entry.end,
+                    text=text,
+                    style=entry.style,
+                )
+            return len(positions[key])
+
+        # Reuse translations from earlier runs
+        cache = _get_translation_cache(config)
+        cache_context = (provider.name, provider.model, source_lang, target_lang_full, keep_names)
+        cached = 0
+        if cache is not None:
+            hits = cache.get_many(positions, cache_context)
+            for key, text in hits.items():
+                cached += fill(key, text)
+            if hits:
+                logger.info("Reused %d cached translations", cached)
+                unique_entries = [e for e in unique_entries if e.text.strip() not in hits]
+
+        # Batch and translate
+        if batch_chars:
+            batches = create_batches_by_budget(
+                unique_entries, max_chars=batch_chars, max_entries=batch_size,
             )
-            if tvdb_context:
-                logger.info("TVDB context loaded for %s", input_path.name)
-        except Exception:
-            logger.debug("TVDB lookup failed, continuing without context", exc_info=True)
-
-    # Batch and translate
-    batches = create_batches(entries, batch_size)
-    logger.info("Processing %d batches (batch_size=%d)", len(batches), batch_size)
-
-    translated_entries: list[SubtitleEntry] = []
-
-    progress = Progress(
-        TextColumn("[bold blue]{task.description}"),
-        BarColumn(),
-        MofNCompleteColumn(),
-        TextColumn("entries"),
-        TimeElapsedColumn(),
-        TimeRemainingColumn(),
-    )
+        else:
+            batches = create_batches(unique_entries, batch_size)
+        logger.info(
+            "Processing %d batches (batch_size=%d, concurrency=%d)",
+            len(batches), batch_size, provider.concurrency,
+        )
 
-    cancelled = False
-    with progress:
-        task = progress.add_task(
-            f"Translating to {target_lang_full}",
-            total=len(entries),
+        progress = Progress(
+            TextColumn("[bold blue]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TextColumn("entries"),
+            TimeElapsedColumn(),
+            TimeRemainingColumn(),
         )
 
-        for i, batch in enumerate(batches, 1):
-            if _cancel_event.is_set():
-                cancelled = True
-                break
-            if _skip_event.is_set():
-                break
+        cancelled = False
+        with progress:
+            task = progress.add_task(
+                f"Translating to {target_lang_full}",
+                total=len(entries),
+                completed=cached,
+            )
 
-            logger.debug("Translating batch %d/%d (%d entries)", i, len(batches), len(batch))
+            def on_result(i: int, results: list[dict[str, Any]]) -> None:
+                batch = batches[i]
+                logger.debug("Translated batch %d/%d (%d entries)", i + 1, len(batches), len(batch))
+                filled = 0
+                new_translations: dict[str, str] = {}
+                for original, result in zip(batch, results):
+                    text = result.get("text", original.text)
+                    key = original.text.strip()
+                    filled += fill(key, text)
+                    # Unchanged text is also what a failed entry falls back to
+                    if text != original.text:
+                        new_translations[key] = text
+                if cache is not None:
+                    cache.put_many(new_translations, cache_context)
+                progress.advance(task, filled)
 
             try:
-                texts = [{"index": e.index, "text": e.text} for e in batch]
-                results = provider.translate(
-                    texts, source_lang, target_lang_full,
+                provider.translate_many(
+                    ([{"index": e.index, "text": e.text} for e in batch] for batch in batches),
+                    source_lang, target_lang_full,
                     keep_names=keep_names,
                     cancel_event=_cancel_event,
                     skip_event=_skip_event,
                     tvdb_context=tvdb_context,
+                    on_result=on_result,
                 )
             except KeyboardInterrupt:
                 cancelled = True
-                break
             except InterruptedError:
-                break
-
-            for j, result in enumerate(results):
-                original = batch[j] if j < len(batch) else batch[-1]
-                translated_entries.append(
-                    SubtitleEntry(
-                        index=original.index,
-                        start=original.start,
-                        end=original.end,
-                        text=result.get("text", original.text),
-                        style=original.style,
-                    )
-                )
-
-            progress.advance(task, len(batch))
+                pass
+    finally:
+        provider.close()
 
     if cancelled:
         logger.info("Translation cancelled by user")
@@ -248,7 +375,7 @@ def translate_file(
 
     if _skip_event.is_set():
         logger.info("File skipped by user")
-        _cleanup_temp_files()
+        _remove_temp_file(extracted_sub_path)
         raise TranslationSkipped()
 
     # Build output
@@ -256,7 +383,7 @@ def translate_file(
     logger.info("Writing output: %s", out)
 
     build_file(
-        entries=translated_entries,
+        entries=[t if t is not None else e for t, e in zip(translated_entries, entries)],
         output_path=out,
         original_path=input_path,
         bilingual=bilingual,
@@ -264,11 +391,8 @@ def translate_file(
     )
 
     # Clean up extracted subtitle file unless in debug mode
-    if extracted_sub_path and not debug:
-        extracted_sub_path.unlink(missing_ok=True)
-        if extracted_sub_path in _temp_files:
-            _temp_files.remove(extracted_sub_path)
-        logger.info("Cleaned up extracted subtitle: %s", extracted_sub_path)
+    if not debug:
+        _remove_temp_file(extracted_sub_path)
 
     logger.info("Translation complete: %s -> %s", input_path, out)
     return out
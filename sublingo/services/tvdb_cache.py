@@ -0,0 +1,65 @@
+"""Persistent cache for TVDB API responses backed by SQLite."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from sublingo.services.translation_cache import default_cache_dir
+from sublingo.utils import json_utils
+from sublingo.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_FILENAME = "tvdb.sqlite3"
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600  # 7 days
+
+
+class TVDBCache:
+    """JSON values keyed by a request identifier, expiring after ttl seconds.
+
+    Shared by the TVDB lookup threads, so access is serialized with a lock.
+    """
+
+    def __init__(self, path: Path, ttl: float = DEFAULT_TTL_SECONDS):
+        self.ttl = ttl
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS records "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, fetched_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM records WHERE key = ? AND fetched_at >= ?",
+                (key, time.time() - self.ttl),
+            ).fetchone()
+        return json_utils.loads(row[0]) if row else None
+
+    def put(self, key: str, value: Any) -> None:
+        """Store value (anything JSON-serializable) under key."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO records (key, value, fetched_at) VALUES (?, ?, ?)",
+                (key, json_utils.dumps(value), time.time()),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def open_tvdb_cache(cache_dir: Path | None = None) -> TVDBCache:
+    """Open (creating if needed) the TVDB cache in cache_dir."""
+    path = (cache_dir or default_cache_dir()) / CACHE_FILENAME
+    logger.debug("TVDB cache: %s", path)
+    return TVDBCache(path)
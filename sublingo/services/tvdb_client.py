@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import threading
 import time
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
+from sublingo.utils import json_utils
 from sublingo.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from sublingo.services.tvdb_cache import TVDBCache
+
 logger = get_logger(__name__)
 
 TVDB_BASE_URL = "https://api4.thetvdb.com/v4"
@@ -16,99 +21,166 @@ TOKEN_EXPIRY_SECONDS = 25 * 24 * 3600  # 25 days
 
 
 class TVDBClient:
-    """Lightweight TVDB API v4 client with token caching."""
+    """Lightweight TVDB API v4 client with token caching.
+
+    If a TVDBCache is given, search results, season episode lists and
+    translations are also kept on disk between runs.
+    """
 
-    def __init__(self, api_key: str, timeout: float = 15.0):
+    def __init__(
+        self, api_key: str, timeout: float = 15.0, cache: TVDBCache | None = None,
+    ):
         self.api_key = api_key
         self.timeout = timeout
+        self.cache = cache
         self._token: str | None = None
-        self._token_time: float = 0
+        self._token_expires_at: float = 0.0  # time.monotonic() deadline
+        self._token_lock = threading.Lock()
         self._series_cache: dict[str, int | None] = {}
+        # (series_id, season) -> {episode number: episode id}
+        self._season_cache: dict[tuple[int, int], dict[int, int]] = {}
+        # Extended record path -> {lang: translation}
+        self._translation_cache: dict[str, dict[str, dict[str, str]]] = {}
+        self._fetch_locks: dict[str, threading.Lock] = {}
+        # One pooled client for all calls; the bearer token is set on it after login
+        self._client = httpx.Client(base_url=TVDB_BASE_URL, timeout=timeout)
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._client.close()
+
+    def _token_valid(self) -> bool:
+        return time.monotonic() < self._token_expires_at
 
     def _ensure_token(self) -> None:
-        """Authenticate with TVDB and cache the bearer token."""
-        if self._token and (time.time() - self._token_time) < TOKEN_EXPIRY_SECONDS:
+        """Authenticate with TVDB and cache the bearer token.
+
+        Safe to call from several threads; only one of them logs in.
+        """
+        if self._token_valid():
             return
-        resp = httpx.post(
-            f"{TVDB_BASE_URL}/login",
-            json={"apikey": self.api_key},
-            timeout=self.timeout,
-        )
-        resp.raise_for_status()
-        self._token = resp.json()["data"]["token"]
-        self._token_time = time.time()
-        logger.debug("TVDB: authenticated successfully")
+        with self._token_lock:
+            if self._token_valid():
+                return
+            resp = self._client.post("/login", json={"apikey": self.api_key})
+            resp.raise_for_status()
+            self._token = json_utils.loads(resp.content)["data"]["token"]
+            self._token_expires_at = time.monotonic() + TOKEN_EXPIRY_SECONDS
+            self._client.headers["Authorization"] = f"Bearer {self._token}"
+            logger.debug("TVDB: authenticated successfully")
 
     def _get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
         """Authenticated GET request to TVDB API."""
         self._ensure_token()
-        resp = httpx.get(
-            f"{TVDB_BASE_URL}{path}",
-            params=params,
-            headers={"Authorization": f"Bearer {self._token}"},
-            timeout=self.timeout,
-        )
+        resp = self._client.get(path, params=params)
         resp.raise_for_status()
-        return resp.json()
+        return json_utils.loads(resp.content)
 
     def search_series(self, name: str) -> int | None:
         """Search for a series by name and return its TVDB ID, or None."""
         if name in self._series_cache:
             return self._series_cache[name]
-        data = self._get("/search", params={"query": name, "type": "series"})
-        results = data.get("data", [])
-        series_id = int(results[0]["tvdb_id"]) if results else None
+        cache_key = f"search:{name}"
+        cached = self.cache.get(cache_key) if self.cache else None
+        if cached is not None:
+            series_id = cached["id"]
+        else:
+            data = self._get("/search", params={"query": name, "type": "series"})
+            results = data.get("data", [])
+            series_id = int(results[0]["tvdb_id"]) if results else None
+            if self.cache:
+                self.cache.put(cache_key, {"id": series_id})
         self._series_cache[name] = series_id
         return series_id
 
+    def _get_translations(self, path: str) -> dict[str, dict[str, str]]:
+        """Fetch all translations of a series/episode from its extended record.
+
+        One request returns every language, so the result is cached by path
+        and later languages (including the English fallback) are local
+        lookups. Returns {lang: {"name": ..., "overview": ...}}.
+        """
+        if path in self._translation_cache:
+            return self._translation_cache[path]
+        # Concurrent lookups of the same record wait for one request
+        with self._fetch_locks.setdefault(path, threading.Lock()):
+            if path in self._translation_cache:
+                return self._translation_cache[path]
+            cached = self.cache.get(path) if self.cache else None
+            if cached is not None:
+                self._translation_cache[path] = cached
+                return cached
+            try:
+                data = self._get(path, params={"meta": "translations", "short": "true"})
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 404:
+                    raise
+                logger.debug("TVDB: %s not found", path)
+                data = {}
+            translations = ((data.get("data") or {}).get("translations")) or {}
+            by_lang: dict[str, dict[str, str]] = {}
+            for item in translations.get("nameTranslations") or []:
+                entry = by_lang.setdefault(item.get("language"), {"name": "", "overview": ""})
+                entry["name"] = item.get("name") or ""
+            for item in translations.get("overviewTranslations") or []:
+                entry = by_lang.setdefault(item.get("language"), {"name": "", "overview": ""})
+                entry["overview"] = item.get("overview") or ""
+            self._translation_cache[path] = by_lang
+            if self.cache:
+                self.cache.put(path, by_lang)
+            return by_lang
+
     def get_series_translation(
         self, series_id: int, lang: str
     ) -> dict[str, str] | None:
         """Fetch series translation (name + overview) for a language code."""
-        try:
-            data = self._get(f"/series/{series_id}/translations/{lang}")
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                logger.debug("TVDB: no series translation for lang %s", lang)
-                return None
-            raise
-        translation = data.get("data")
-        if not translation:
-            return None
-        return {
-            "name": translation.get("name", ""),
-            "overview": translation.get("overview", ""),
-        }
+        translation = self._get_translations(f"/series/{series_id}/extended").get(lang)
+        if translation is None:
+            logger.debug("TVDB: no series translation for lang %s", lang)
+        return translation
 
     def get_episode_id(
         self, series_id: int, season: int, episode: int
     ) -> int | None:
-        """Find the episode ID for a given season/episode number."""
-        data = self._get(
-            f"/series/{series_id}/episodes/default",
-            params={"season": season, "episodeNumber": episode, "page": 0},
-        )
-        episodes = data.get("data", {}).get("episodes", [])
-        for ep in episodes:
-            if ep.get("seasonNumber") == season and ep.get("number") == episode:
-                return int(ep["id"])
-        return None
+        """Find the episode ID for a given season/episode number.
+
+        The whole season is fetched once and kept, so the other episodes
+        of that season need no further requests.
+        """
+        key = (series_id, season)
+        cache_key = f"season:{series_id}:{season}"
+        episode_ids = self._season_cache.get(key)
+        if episode_ids is None and self.cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                # JSON object keys come back as strings
+                episode_ids = {int(number): ep_id for number, ep_id in cached.items()}
+                self._season_cache[key] = episode_ids
+        if episode_ids is None:
+            episode_ids = {}
+            page = 0
+            while True:
+                data = self._get(
+                    f"/series/{series_id}/episodes/default",
+                    params={"season": season, "page": page},
+                )
+                for ep in data.get("data", {}).get("episodes", []):
+                    if ep.get("seasonNumber") == season and ep.get("number") is not None:
+                        episode_ids.setdefault(ep["number"], int(ep["id"]))
+                if not (data.get("links") or {}).get("next"):
+                    break
+                page += 1
+            self._season_cache[key] = episode_ids
+            if self.cache:
+                # JSON object keys must be strings (orjson rejects int keys)
+                self.cache.put(cache_key, {str(number): ep_id for number, ep_id in episode_ids.items()})
+        return episode_ids.get(episode)
 
     def get_episode_translation(
         self, episode_id: int, lang: str
     ) -> dict[str, str] | None:
         """Fetch episode translation (name + overview) for a language code."""
-        try:
-            data = self._get(f"/episodes/{episode_id}/translations/{lang}")
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                logger.debug("TVDB: no episode translation for lang %s", lang)
-                return None
-            raise
-        translation = data.get("data")
-        if not translation:
-            return None
-        return {
-            "name": translation.get("name", ""),
-            "overview": translation.get("overview", ""),
-        }
+        translation = self._get_translations(f"/episodes/{episode_id}/extended").get(lang)
+        if translation is None:
+            logger.debug("TVDB: no episode translation for lang %s", lang)
+        return translation
@@ -3,74 +3,113 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import json
 import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from sublingo.services.tvdb_client import TVDBClient
 from sublingo.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+TVDB_MAX_WORKERS = 4  # concurrent TVDB lookups per file
+GOOGLE_CACHE_SIZE = 1024  # memoized Google Translate results
 
-def _google_translate(text: str, dest: str) -> str | None:
-    """Translate text using googletrans. Returns translated text or None on failure."""
+
+async def _google_translate_all(texts: list[str], dest: str) -> list[str]:
+    from googletrans import Translator
+
+    async with Translator() as translator:
+        # A list is translated as one batch on a single client
+        results = await translator.translate(texts, dest=dest)
+    return [r.text for r in results]
+
+
+# (text, dest) -> translation; the same series overview comes up for every
+# episode file, so it is only translated once per run
+_google_cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+_google_cache_lock = threading.Lock()
+
+
+def _google_translate_batch(texts: list[str], dest: str) -> dict[str, str]:
+    """Translate texts with googletrans in one batch, memoized per text.
+
+    Returns {text: translation} for the texts that could be translated.
+    """
+    result: dict[str, str] = {}
+    with _google_cache_lock:
+        for text in texts:
+            hit = _google_cache.get((text, dest))
+            if hit is not None:
+                _google_cache.move_to_end((text, dest))
+                result[text] = hit
+    missing = [text for text in dict.fromkeys(texts) if text not in result]
+    if not missing:
+        return result
     try:
-        from googletrans import Translator
-        translator = Translator()
-        # googletrans 4.x is async
-        result = asyncio.run(translator.translate(text, dest=dest))
-        return result.text
+        # googletrans 4.x is async; one event loop and client per batch
+        translated = asyncio.run(_google_translate_all(missing, dest))
     except Exception as e:
         logger.debug("Google Translate failed: %s", e)
-        return None
+        return result
+    with _google_cache_lock:
+        for text, trans in zip(missing, translated):
+            if trans:
+                result[text] = trans
+                _google_cache[(text, dest)] = trans
+                if len(_google_cache) > GOOGLE_CACHE_SIZE:
+                    _google_cache.popitem(last=False)
+    return result
 
 
-def _google_translate_dict(
-    data: dict[str, str], dest: str,
-) -> dict[str, str]:
-    """Translate name/overview values in a TVDB translation dict via Google Translate."""
-    result = {}
-    for key in ("name", "overview"):
-        val = data.get(key, "")
-        if val:
-            translated = _google_translate(val, dest)
-            result[key] = translated if translated else val
-        else:
-            result[key] = val
-    return result
+def _google_translate_dicts(
+    dicts: list[dict[str, str]], dest: str,
+) -> list[dict[str, str]]:
+    """Translate name/overview values of TVDB translation dicts in one batch."""
+    results = [{key: data.get(key, "") for key in ("name", "overview")} for data in dicts]
+    texts = [val for result in results for val in result.values() if val]
+    if texts:
+        translated = _google_translate_batch(texts, dest)
+        for result in results:
+            for key, val in result.items():
+                if val in translated:
+                    result[key] = translated[val]
+    return results
 
-_TVDB_LANGUAGES: dict[str, str] | None = None
+TVDB_LANGUAGES_FILE = Path(__file__).resolve().parent.parent / "utils" / "tvdb_languages.json"
 
 
 def _load_tvdb_languages() -> dict[str, str]:
-    global _TVDB_LANGUAGES
-    if _TVDB_LANGUAGES is None:
-        lang_file = Path(__file__).resolve().parent.parent / "utils" / "tvdb_languages.json"
-        with open(lang_file, encoding="utf-8") as f:
-            _TVDB_LANGUAGES = json.load(f)
-    return _TVDB_LANGUAGES
+    with open(TVDB_LANGUAGES_FILE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+# sublingo code -> TVDB 3-letter code, loaded once at import
+_TVDB_LANGUAGES: dict[str, str] = _load_tvdb_languages()
 
 
 # Patterns for extracting series info from filenames
-_PATTERNS = [
+_PATTERN_SOURCES = [
     # Sonarr style: "South Park - S01E01 - Title.srt"
-    re.compile(
-        r"^(?P<series>.+?)\s*-\s*S(?P<season>\d+)E(?P<episode>\d+)",
-        re.IGNORECASE,
-    ),
+    r"(?P<series{n}>.+?)\s*-\s*S(?P<season{n}>\d+)E(?P<episode{n}>\d+)",
     # Dot-separated: "South.Park.S01E01.720p.srt"
-    re.compile(
-        r"^(?P<series>.+?)\.S(?P<season>\d+)E(?P<episode>\d+)",
-        re.IGNORECASE,
-    ),
+    r"(?P<series{n}>.+?)\.S(?P<season{n}>\d+)E(?P<episode{n}>\d+)",
     # Numbered: "South Park 1x01.srt"
-    re.compile(
-        r"^(?P<series>.+?)\s+(?P<season>\d+)x(?P<episode>\d+)",
-        re.IGNORECASE,
-    ),
+    r"(?P<series{n}>.+?)\s+(?P<season{n}>\d+)x(?P<episode{n}>\d+)",
 ]
+# One alternation, tried in the order above, so the stem is scanned in a
+# single match() call; each branch has its own numbered groups
+_SERIES_RE = re.compile(
+    "^(?:" + "|".join(src.format(n=n) for n, src in enumerate(_PATTERN_SOURCES)) + ")",
+    re.IGNORECASE,
+)
+# Every branch needs "S01E01" or "1x01"; movie names are rejected on this
+# cheap search before the backtracking .+? branches run
+_SERIES_SCREEN_RE = re.compile(r"S\d+E\d|\dx\d", re.IGNORECASE)
 
 
 def parse_series_info(filename: str) -> dict[str, Any] | None:
@@ -78,56 +117,67 @@ def parse_series_info(filename: str) -> dict[str, Any] | None:
 
     Returns dict with keys: series, season, episode — or None if no match.
     """
-    stem = Path(filename).stem
-    for pattern in _PATTERNS:
-        m = pattern.match(stem)
-        if m:
-            series = m.group("series").replace(".", " ").strip()
-            return {
-                "series": series,
-                "season": int(m.group("season")),
-                "episode": int(m.group("episode")),
-            }
-    return None
+    # The patterns only match a prefix ending in the episode number, so the
+    # extension never affects the result and needs no stripping
+    if not _SERIES_SCREEN_RE.search(filename):
+        return None
+    m = _SERIES_RE.match(filename)
+    if not m:
+        return None
+    # Groups are numbered 1-3 for the first branch, 4-6 for the second, ...
+    n = (m.lastindex - 1) // 3
+    series = m.group(f"series{n}").replace(".", " ").strip()
+    return {
+        "series": series,
+        "season": int(m.group(f"season{n}")),
+        "episode": int(m.group(f"episode{n}")),
+    }
 
 
 def resolve_tvdb_language(sublingo_code: str) -> str | None:
     """Map a sublingo language code to a TVDB 3-letter language code."""
-    langs = _load_tvdb_languages()
-    return langs.get(sublingo_code)
+    return _TVDB_LANGUAGES.get(sublingo_code)
 
 
-def _fetch_translations(
-    client: TVDBClient,
-    series_id: int,
-    episode_id: int | None,
+def _fetch_translation(
+    fetch: Callable[[int, str], dict[str, str] | None],
+    obj_id: int,
     tvdb_lang: str,
-    sublingo_code: str,
 ) -> tuple[dict[str, str] | None, dict[str, str] | None]:
-    """Fetch series and episode translations for a single language.
+    """Fetch one series or episode translation for a single language.
 
-    Falls back to Google Translate (from English) when TVDB lacks a translation.
+    Returns (translation, english): when TVDB lacks the translation,
+    english holds the English one for the Google Translate fallback.
     """
-    # googletrans uses lowercase hyphenated codes like "zh-tw"
-    gtrans_dest = sublingo_code.lower()
+    trans = fetch(obj_id, tvdb_lang)
+    if trans is None and tvdb_lang != "eng":
+        return None, fetch(obj_id, "eng")
+    return trans, None
 
-    series_trans = client.get_series_translation(series_id, tvdb_lang)
-    if series_trans is None and tvdb_lang != "eng":
-        eng_series = client.get_series_translation(series_id, "eng")
-        if eng_series:
-            logger.debug("TVDB: no series translation for %s, falling back to Google Translate", tvdb_lang)
-            series_trans = _google_translate_dict(eng_series, gtrans_dest)
 
-    episode_trans = None
-    if episode_id is not None:
-        episode_trans = client.get_episode_translation(episode_id, tvdb_lang)
-        if episode_trans is None and tvdb_lang != "eng":
-            eng_episode = client.get_episode_translation(episode_id, "eng")
-            if eng_episode:
-                logger.debug("TVDB: no episode translation for %s, falling back to Google Translate", tvdb_lang)
-                episode_trans = _google_translate_dict(eng_episode, gtrans_dest)
+def _fill_from_english(
+    fetched: list[tuple[dict[str, str] | None, dict[str, str] | None]],
+    tvdb_lang: str,
+    sublingo_code: str,
+) -> list[dict[str, str] | None]:
+    """Resolve fetched translations, Google-translating the missing ones.
 
-    return series_trans, episode_trans
+    All fallbacks for one language go out in a single batch.
+    """
+    results = [trans for trans, _ in fetched]
+    pending = [i for i, (trans, english) in enumerate(fetched) if trans is None and english]
+    if pending:
+        logger.debug(
+            "TVDB: %d translation(s) missing for %s, falling back to Google Translate",
+            len(pending), tvdb_lang,
+        )
+        # googletrans uses lowercase hyphenated codes like "zh-tw"
+        translated = _google_translate_dicts(
+            [fetched[i][1] for i in pending], sublingo_code.lower(),
+        )
+        for i, trans in zip(pending, translated):
+            results[i] = trans
+    return results
 
 
 def _append_translation_lines(
@@ -140,16 +190,21 @@ def _append_translation_lines(
 ) -> None:
     """Append formatted translation lines for one language."""
     if series_trans:
-        if series_trans.get("name"):
-            lines.append(f"Series title ({label}): {series_trans['name']}")
-        if series_trans.get("overview"):
-            lines.append(f"Series description ({label}): {series_trans['overview']}")
+        name = series_trans.get("name")
+        overview = series_trans.get("overview")
+        if name:
+            lines.append(f"Series title ({label}): {name}")
+        if overview:
+            lines.append(f"Series description ({label}): {overview}")
     if episode_trans:
-        ep_label = f"S{season:02d}E{episode:02d}"
-        if episode_trans.get("name"):
-            lines.append(f"Episode title ({label}, {ep_label}): {episode_trans['name']}")
-        if episode_trans.get("overview"):
-            lines.append(f"Episode description ({label}, {ep_label}): {episode_trans['overview']}")
+        name = episode_trans.get("name")
+        overview = episode_trans.get("overview")
+        if name or overview:
+            ep_label = f"S{season:02d}E{episode:02d}"
+            if name:
+                lines.append(f"Episode title ({label}, {ep_label}): {name}")
+            if overview:
+                lines.append(f"Episode description ({label}, {ep_label}): {overview}")
 
 
 def build_tvdb_context(
@@ -212,10 +267,27 @@ def build_tvdb_context(
     ]
     has_content = False
 
-    for label, tvdb_lang, sublingo_code in langs_to_fetch:
-        series_trans, episode_trans = _fetch_translations(
-            client, series_id, episode_id, tvdb_lang, sublingo_code,
-        )
+    # Series/episode lookups for each language are independent, so run them
+    # concurrently; results are still appended in label order below
+    with concurrent.futures.ThreadPoolExecutor(max_workers=TVDB_MAX_WORKERS) as pool:
+        futures = [
+            (
+                pool.submit(
+                    _fetch_translation, client.get_series_translation, series_id, tvdb_lang,
+                ),
+                pool.submit(
+                    _fetch_translation, client.get_episode_translation, episode_id, tvdb_lang,
+                ) if episode_id is not None else None,
+            )
+            for _, tvdb_lang, _ in langs_to_fetch
+        ]
+        fetched = [
+            (series.result(), episode.result() if episode else (None, None))
+            for series, episode in futures
+        ]
+
+    for (label, tvdb_lang, sublingo_code), pair in zip(langs_to_fetch, fetched):
+        series_trans, episode_trans = _fill_from_english(list(pair), tvdb_lang, sublingo_code)
         if series_trans or episode_trans:
             has_content = True
             _append_translation_lines(
@@ -14,12 +14,41 @@ DEFAULTS: dict[str, Any] = {
     "api_key": None,
     "temperature": 0.3,
     "batch_size": 20,
+    "batch_chars": None,  # None means batch by entry count only
+    "concurrency": 1,
     "source_language": "auto",
     "target_language": None,
     "bilingual": False,
     "output_format": None,  # None means same as input
     "verbose": False,
     "tvdb_api_key": None,
+    "cache": True,  # persistent translation cache
+    "cache_dir": None,  # None means $XDG_CACHE_HOME/sublingo
+}
+
+
+# Env vars (SUBLINGO_ prefix) -> config keys
+ENV_MAP: dict[str, str] = {
+    "SUBLINGO_PROVIDER": "provider",
+    "SUBLINGO_MODEL": "model",
+    "SUBLINGO_BASE_URL": "base_url",
+    "SUBLINGO_API_KEY": "api_key",
+    "SUBLINGO_TEMPERATURE": "temperature",
+    "SUBLINGO_BATCH_SIZE": "batch_size",
+    "SUBLINGO_BATCH_CHARS": "batch_chars",
+    "SUBLINGO_CONCURRENCY": "concurrency",
+    "SUBLINGO_SOURCE_LANGUAGE": "source_language",
+    "SUBLINGO_TARGET_LANGUAGE": "target_language",
+    "SUBLINGO_TVDB_API_KEY": "tvdb_api_key",
+    "SUBLINGO_CACHE_DIR": "cache_dir",
+}
+
+# Config keys whose env values need converting from str
+_CASTS: dict[str, Any] = {
+    "temperature": float,
+    "batch_size": int,
+    "batch_chars": int,
+    "concurrency": int,
 }
 
 
@@ -32,30 +61,15 @@ def build_config(
     config = dict(DEFAULTS)
 
     # Layer 2: env vars (SUBLINGO_ prefix)
-    env_map = {
-        "SUBLINGO_PROVIDER": "provider",
-        "SUBLINGO_MODEL": "model",
-        "SUBLINGO_BASE_URL": "base_url",
-        "SUBLINGO_API_KEY": "api_key",
-        "SUBLINGO_TEMPERATURE": "temperature",
-        "SUBLINGO_BATCH_SIZE": "batch_size",
-        "SUBLINGO_SOURCE_LANGUAGE": "source_language",
-        "SUBLINGO_TARGET_LANGUAGE": "target_language",
-        "SUBLINGO_TVDB_API_KEY": "tvdb_api_key",
-    }
-    for env_key, cfg_key in env_map.items():
-        val = os.environ.get(env_key)
+    env = os.environ
+    for env_key, cfg_key in ENV_MAP.items():
+        val = env.get(env_key)
         if val is not None:
-            if cfg_key == "temperature":
-                config[cfg_key] = float(val)
-            elif cfg_key == "batch_size":
-                config[cfg_key] = int(val)
-            else:
-                config[cfg_key] = val
+            config[cfg_key] = _CASTS.get(cfg_key, str)(val)
 
     # Also check provider-specific API key env vars
     if config["api_key"] is None:
-        config["api_key"] = os.environ.get("OPENAI_API_KEY")
+        config["api_key"] = env.get("OPENAI_API_KEY")
 
     # Layer 3: CLI args (override everything)
     if cli_args:
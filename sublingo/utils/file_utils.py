@@ -4,16 +4,19 @@ from __future__ import annotations
 
 from pathlib import Path
 
-SUBTITLE_EXTENSIONS = {".srt", ".vtt", ".ass", ".ssa"}
-VIDEO_EXTENSIONS = {".mkv", ".mp4", ".avi", ".webm", ".mov", ".flv", ".wmv"}
+SUBTITLE_EXTENSIONS = frozenset({".srt", ".vtt", ".ass", ".ssa"})
+VIDEO_EXTENSIONS = frozenset({".mkv", ".mp4", ".avi", ".webm", ".mov", ".flv", ".wmv"})
 
 
 def is_subtitle_file(path: Path) -> bool:
-    return path.suffix.lower() in SUBTITLE_EXTENSIONS
+    # Most suffixes are already lowercase; only lower() the rest
+    suffix = path.suffix
+    return suffix in SUBTITLE_EXTENSIONS or suffix.lower() in SUBTITLE_EXTENSIONS
 
 
 def is_video_file(path: Path) -> bool:
-    return path.suffix.lower() in VIDEO_EXTENSIONS
+    suffix = path.suffix
+    return suffix in VIDEO_EXTENSIONS or suffix.lower() in VIDEO_EXTENSIONS
 
 
 def generate_output_path(
@@ -41,8 +44,8 @@ def generate_output_path(
 
     stem = input_path.stem
     # Strip existing language code if present (e.g., "movie.en" -> "movie")
-    parts = stem.rsplit(".", 1)
-    if len(parts) == 2 and len(parts[1]) <= 3 and parts[1].isalpha():
-        stem = parts[0]
+    dot = stem.rfind(".")
+    if dot != -1 and len(stem) - dot <= 4 and stem[dot + 1:].isalpha():
+        stem = stem[:dot]
 
     return input_path.parent / f"{stem}.{target_lang}{suffix}"
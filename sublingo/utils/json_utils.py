@@ -0,0 +1,98 @@
+"""JSON helpers that use orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Iterator
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+# orjson.JSONDecodeError subclasses this, so callers catch one type either way
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to a UTF-8 JSON string (non-ASCII kept as-is).
+
+    Compact by default; indent=True gives two-space indentation.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def iter_balanced(text: str, open_char: str, close_char: str) -> Iterator[str]:
+    """Yield each top-level balanced open_char...close_char span in text.
+
+    A single linear scan that skips brackets inside JSON strings, so it
+    stays O(n) on long or malformed output where a greedy regex would not.
+    An unclosed span ends the scan.
+    """
+    for start, end in BalancedScanner(open_char, close_char).scan(text):
+        yield text[start:end + 1]
+
+
+class BalancedScanner:
+    """Bracket matcher for text that may arrive in pieces.
+
+    scan() yields the (start, end) offsets of each top-level
+    open_char...close_char span, counted from the first character ever
+    scanned; feed() returns True once the first span is complete, e.g. to
+    stop reading a streamed response early.
+    """
+
+    def __init__(self, open_char: str = "[", close_char: str = "]"):
+        self.open_char = open_char
+        self.close_char = close_char
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.start = 0  # offset of the current span's open_char
+        self.pos = 0  # offset of the next character to scan
+
+    def scan(self, chunk: str) -> Iterator[tuple[int, int]]:
+        # State lives in locals for the hot loop and is written back
+        # before each yield and at the end of the chunk
+        open_char, close_char = self.open_char, self.close_char
+        depth, in_string, escape, start = self.depth, self.in_string, self.escape, self.start
+        base = self.pos
+        for i, ch in enumerate(chunk, base):
+            if depth == 0:
+                if ch == open_char:
+                    depth = 1
+                    start = i
+                continue
+            if in_string:
+                if escape:
+                    escape = False
+                elif ch == "\\":
+                    escape = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch == open_char:
+                depth += 1
+            elif ch == close_char:
+                depth -= 1
+                if depth == 0:
+                    self.depth, self.in_string, self.escape = 0, False, False
+                    self.start, self.pos = start, i + 1
+                    yield start, i
+        self.depth, self.in_string, self.escape = depth, in_string, escape
+        self.start, self.pos = start, base + len(chunk)
+
+    def feed(self, chunk: str) -> bool:
+        return next(self.scan(chunk), None) is not None
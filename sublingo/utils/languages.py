@@ -5,36 +5,36 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-_LANGUAGES: dict[str, str] | None = None
+LANGUAGES_FILE = Path(__file__).parent / "languages.json"
 
 
 def _load() -> dict[str, str]:
-    global _LANGUAGES
-    if _LANGUAGES is None:
-        path = Path(__file__).parent / "languages.json"
-        with open(path) as f:
-            _LANGUAGES = json.load(f)
-    return _LANGUAGES
+    with open(LANGUAGES_FILE, encoding="utf-8") as f:
+        return json.load(f)
+
+
+# Loaded once at import; the table is small and always needed
+_LANGUAGES: dict[str, str] = _load()
+# Lowercased codes for case-insensitive lookup; built in reverse so the
+# first code in the file wins if two differ only by case
+_LANGUAGES_CI: dict[str, str] = {
+    code.lower(): name for code, name in reversed(_LANGUAGES.items())
+}
 
 
 def resolve_language(code_or_name: str) -> str:
     """Resolve a language code to its full name for use in prompts.
 
     If the input is a known code (e.g. "zh-TW"), returns the full name
-    (e.g. "Traditional Chinese"). Otherwise returns the input as-is.
+    (e.g. "Traditional Chinese"), matching case-insensitively. Otherwise
+    returns the input as-is (it might already be a full name).
     """
-    languages = _load()
-    # Exact match
-    if code_or_name in languages:
-        return languages[code_or_name]
-    # Case-insensitive match
-    for code, name in languages.items():
-        if code.lower() == code_or_name.lower():
-            return name
-    # Not a known code, return as-is (might already be a full name)
-    return code_or_name
+    name = _LANGUAGES.get(code_or_name)
+    if name is not None:
+        return name
+    return _LANGUAGES_CI.get(code_or_name.lower(), code_or_name)
 
 
 def list_languages() -> dict[str, str]:
     """Return all supported language codes and names."""
-    return dict(_load())
+    return dict(_LANGUAGES)
@@ -9,17 +9,34 @@ LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
 LOG_FORMAT_VERBOSE = "%(asctime)s [%(levelname)s] %(name)s (%(filename)s:%(lineno)d): %(message)s"
 
 
+_handler: logging.StreamHandler | None = None
+_formatters: dict[str, logging.Formatter] = {}
+
+
 def setup_logging(verbose: bool = False, debug: bool = False) -> logging.Logger:
+    """Configure the "sublingo" logger; safe to call repeatedly.
+
+    The same stderr handler is reused and only its level/formatter are
+    updated, so repeated calls don't allocate or stack handlers.
+    """
+    global _handler
     level = logging.DEBUG if (verbose or debug) else logging.INFO
     fmt = LOG_FORMAT_VERBOSE if (verbose or debug) else LOG_FORMAT
 
-    handler = logging.StreamHandler(sys.stderr)
-    handler.setFormatter(logging.Formatter(fmt))
+    if _handler is None:
+        _handler = logging.StreamHandler(sys.stderr)
+    elif _handler.stream is not sys.stderr:
+        _handler.setStream(sys.stderr)
+    formatter = _formatters.get(fmt)
+    if formatter is None:
+        formatter = _formatters[fmt] = logging.Formatter(fmt)
+    _handler.setFormatter(formatter)
 
     logger = logging.getLogger("sublingo")
     logger.setLevel(level)
-    logger.handlers.clear()
-    logger.addHandler(handler)
+    if logger.handlers != [_handler]:
+        logger.handlers.clear()
+        logger.addHandler(_handler)
     return logger
 
 
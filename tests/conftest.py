@@ -0,0 +1,28 @@
+"""Shared test fixtures."""
+
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def mock_provider():
+    """Patch get_provider with a mock that "translates" by upper-casing.
+
+    translate_many records every batch it is given in mock.sent and
+    reports each one through on_result. Tests that need another outcome
+    (skip, error) replace translate_many.side_effect.
+    """
+    with patch("sublingo.services.translation_service.get_provider") as mock_get:
+        provider = mock_get.return_value
+        provider.name = "mock"
+        provider.model = "test"
+        provider.sent = []
+
+        def translate_many(batches, *args, on_result=None, **kwargs):
+            for i, batch in enumerate(batches):
+                provider.sent.append(batch)
+                on_result(i, [{"index": e["index"], "text": e["text"].upper()} for e in batch])
+
+        provider.translate_many.side_effect = translate_many
+        yield provider
@@ -2,7 +2,7 @@
 
 import pytest
 
-from sublingo.core.batching import create_batches
+from sublingo.core.batching import create_batches, create_batches_by_budget
 from sublingo.core.subtitle_parser import SubtitleEntry
 
 
@@ -51,3 +51,45 @@ def test_batch_size_one():
 def test_invalid_batch_size():
     with pytest.raises(ValueError):
         create_batches(_make_entries(5), batch_size=0)
+
+
+def test_budget_packs_short_lines():
+    entries = _make_entries(30)  # "Line N" is 6-7 chars
+    batches = create_batches_by_budget(entries, max_chars=1000, max_entries=50)
+    assert len(batches) == 1
+    assert len(batches[0]) == 30
+
+
+def test_budget_splits_on_chars():
+    entries = [
+        SubtitleEntry(index=i, start=0, end=1, text="x" * 40) for i in range(10)
+    ]
+    batches = create_batches_by_budget(entries, max_chars=100, max_entries=50)
+    assert [len(b) for b in batches] == [2, 2, 2, 2, 2]
+
+
+def test_budget_respects_max_entries():
+    batches = create_batches_by_budget(_make_entries(25), max_chars=10_000, max_entries=10)
+    assert [len(b) for b in batches] == [10, 10, 5]
+
+
+def test_budget_oversized_entry_alone():
+    entries = [
+        SubtitleEntry(index=0, start=0, end=1, text="short"),
+        SubtitleEntry(index=1, start=0, end=1, text="y" * 500),
+        SubtitleEntry(index=2, start=0, end=1, text="short"),
+    ]
+    batches = create_batches_by_budget(entries, max_chars=100)
+    assert [[e.index for e in b] for b in batches] == [[0], [1], [2]]
+
+
+def test_budget_custom_measure():
+    batches = create_batches_by_budget(
+        _make_entries(6), max_chars=3, measure=lambda text: 1,
+    )
+    assert [len(b) for b in batches] == [2, 2, 2]
+
+
+def test_budget_invalid():
+    with pytest.raises(ValueError):
+        create_batches_by_budget(_make_entries(2), max_chars=0)
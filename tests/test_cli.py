@@ -0,0 +1,93 @@
+"""Tests for CLI file discovery and the translate loop."""
+
+import shutil
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from sublingo.cli import _collect_files, cli
+from sublingo.services import translation_service
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _touch(root: Path, *names: str) -> None:
+    for name in names:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+
+
+def test_collect_files_flat(tmp_path):
+    _touch(tmp_path, "a.srt", "b.MKV", "notes.txt", "sub/c.vtt")
+    files = _collect_files(tmp_path)
+    assert [f.name for f in files] == ["a.srt", "b.MKV"]
+
+
+def test_collect_files_recursive(tmp_path):
+    _touch(tmp_path, "a.srt", "sub/c.vtt", "sub/deep/d.mp4")
+    files = _collect_files(tmp_path, recursive=True)
+    assert [f.relative_to(tmp_path).as_posix() for f in files] == [
+        "a.srt", "sub/c.vtt", "sub/deep/d.mp4",
+    ]
+
+
+def test_collect_files_skips_translated(tmp_path):
+    _touch(tmp_path, "movie.srt", "movie.ja.srt")
+    files = _collect_files(tmp_path, target_lang="ja")
+    assert [f.name for f in files] == ["movie.srt"]
+
+
+def test_collect_single_file(tmp_path):
+    _touch(tmp_path, "movie.srt")
+    assert _collect_files(tmp_path / "movie.srt") == [tmp_path / "movie.srt"]
+
+
+def test_skip_keeps_next_video_subtitles(tmp_path, mock_provider):
+    """Skipping a video must not delete the prefetched subtitles of the next one."""
+    _touch(tmp_path, "a.mkv", "b.mkv")
+
+    def fake_extract(video_path: Path) -> Path:
+        sub_path = video_path.with_suffix(".srt")
+        shutil.copy(FIXTURES / "sample.srt", sub_path)
+        return sub_path
+
+    translate_rest = mock_provider.translate_many.side_effect
+    calls: list[int] = []
+
+    def skip_first(batches, *args, skip_event=None, **kwargs):
+        calls.append(1)
+        if len(calls) > 1:
+            return translate_rest(batches, *args, skip_event=skip_event, **kwargs)
+        # Skip a.mkv once b.mkv's subtitles have been extracted in the background
+        deadline = time.monotonic() + 5
+        while tmp_path / "b.srt" not in translation_service._temp_files and time.monotonic() < deadline:
+            time.sleep(0.01)
+        skip_event.set()
+        raise InterruptedError
+
+    mock_provider.translate_many.side_effect = skip_first
+    with patch("sublingo.services.translation_service.extract_subtitles", fake_extract):
+        result = CliRunner().invoke(
+            cli, ["translate", str(tmp_path), "--to", "ja", "--from", "en", "--no-cache"],
+        )
+
+    assert "Skipped: a.mkv" in result.output
+    assert "Error" not in result.output
+    assert (tmp_path / "b.ja.srt").exists()
+    assert not (tmp_path / "a.srt").exists()
+    assert not (tmp_path / "b.srt").exists()
+
+
+def test_translate_leaves_cancel_event_clear(tmp_path, mock_provider):
+    """A finished CLI run must not leave later translate_file calls cancelled."""
+    shutil.copy(FIXTURES / "sample.srt", tmp_path / "a.srt")
+    result = CliRunner().invoke(
+        cli, ["translate", str(tmp_path), "--to", "ja", "--from", "en", "--no-cache"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / "a.ja.srt").exists()
+    assert not translation_service._cancel_event.is_set()
@@ -0,0 +1,22 @@
+"""Tests for file path helpers."""
+
+from pathlib import Path
+
+from sublingo.utils.file_utils import generate_output_path
+
+
+def test_replaces_language_code():
+    assert generate_output_path(Path("show/movie.en.srt"), "ja") == Path("show/movie.ja.srt")
+
+
+def test_keeps_non_language_suffix():
+    assert generate_output_path(Path("movie.2010.srt"), "ja") == Path("movie.2010.ja.srt")
+    assert generate_output_path(Path("movie.bluray.srt"), "ja") == Path("movie.bluray.ja.srt")
+
+
+def test_video_defaults_to_srt():
+    assert generate_output_path(Path("movie.mkv"), "es") == Path("movie.es.srt")
+
+
+def test_output_format_override():
+    assert generate_output_path(Path("movie.srt"), "es", output_format="ass") == Path("movie.es.ass")
@@ -0,0 +1,25 @@
+"""Tests for source language detection."""
+
+from sublingo.core.subtitle_parser import SubtitleEntry
+from sublingo.services.language_detection import MAX_SAMPLE_CHARS, _sample_text
+
+
+def _entries(texts: list[str]) -> list[SubtitleEntry]:
+    return [SubtitleEntry(index=i, start=i, end=i + 1, text=t) for i, t in enumerate(texts)]
+
+
+def test_sample_spread_across_file():
+    entries = _entries([f"line {i}" for i in range(100)])
+    assert _sample_text(entries, 5).splitlines() == [
+        "line 0", "line 20", "line 40", "line 60", "line 80",
+    ]
+
+
+def test_short_file_uses_all_entries():
+    entries = _entries(["a", "b"])
+    assert _sample_text(entries, 5) == "a\nb"
+
+
+def test_sample_capped():
+    entries = _entries(["x" * 1000] * 5)
+    assert len(_sample_text(entries, 5)) == MAX_SAMPLE_CHARS
@@ -1,25 +1,34 @@
 """Tests for provider abstraction and JSON parsing."""
 
 import json
+import threading
+import time
 
+import httpx
 import pytest
 
-from sublingo.providers.base import BaseLLMProvider, extract_json_array
+from sublingo.providers.base import (
+    REPAIR_PROMPT_SUFFIX,
+    REPAIR_USER_SUFFIX,
+    BaseLLMProvider,
+    extract_json_array,
+)
+from sublingo.providers.openai_provider import OpenAIProvider
 
 
 class MockProvider(BaseLLMProvider):
     """Mock provider for testing."""
 
+    name = "mock"
+
     def __init__(self, responses: list[str] | None = None):
         super().__init__(model="test", temperature=0.3)
         self.responses = responses or []
         self._call_count = 0
+        self.calls: list[tuple[str, str, float | None]] = []
 
-    @property
-    def name(self) -> str:
-        return "mock"
-
-    def _call_api(self, system_prompt: str, user_prompt: str) -> str:
+    def _call_api(self, system_prompt: str, user_prompt: str, temperature=None) -> str:
+        self.calls.append((system_prompt, user_prompt, temperature))
         if self._call_count < len(self.responses):
             resp = self.responses[self._call_count]
             self._call_count += 1
@@ -27,6 +36,29 @@ class MockProvider(BaseLLMProvider):
         raise RuntimeError("No more mock responses")
 
 
+class EchoProvider(BaseLLMProvider):
+    """Provider that "translates" by upper-casing the entries in the prompt."""
+
+    name = "echo"
+
+    def __init__(self, delay: float = 0.0):
+        super().__init__(model="test", temperature=0.3)
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _call_api(self, system_prompt: str, user_prompt: str, temperature=None) -> str:
+        with self._lock:
+            self.calls += 1
+        entries = json.loads(user_prompt.split("Subtitle entries:", 1)[1])
+        if self.delay:
+            # Earlier batches finish last to exercise out-of-order completion
+            time.sleep(self.delay / (entries[0]["index"] + 1))
+        return json.dumps([
+            {"index": e["index"], "text": e["text"].upper()} for e in entries
+        ])
+
+
 class TestExtractJsonArray:
     def test_plain_json(self):
         text = '[{"index": 0, "text": "Hello"}]'
@@ -43,6 +75,16 @@ class TestExtractJsonArray:
         result = extract_json_array(text)
         assert result == [{"index": 0, "text": "Hola"}]
 
+    def test_trailing_text_after_array(self):
+        text = '  [{"index": 0, "text": "Hola"}]\nHope this helps! [1]'
+        result = extract_json_array(text)
+        assert result == [{"index": 0, "text": "Hola"}]
+
+    def test_array_after_bracketed_prose(self):
+        text = 'Sure [translated]: [{"index": 0, "text": "a ] b"}] done [1]'
+        result = extract_json_array(text)
+        assert result == [{"index": 0, "text": "a ] b"}]
+
     def test_invalid_json_raises(self):
         with pytest.raises(ValueError):
             extract_json_array("this is not json at all")
@@ -76,3 +118,309 @@ class TestMockProvider:
         texts = [{"index": 0, "text": "Hello"}]
         with pytest.raises(RuntimeError, match="Failed to get valid translation"):
             provider.translate(texts, "English", "Spanish")
+
+    def test_repair_prompt_after_bad_json(self):
+        good = json.dumps([{"index": 0, "text": "Hola"}])
+        provider = MockProvider(responses=["not json", good])
+        provider.translate([{"index": 0, "text": "Hello"}], "English", "Spanish")
+        (first_system, first_user, first_temp), (repair_system, repair_user, repair_temp) = (
+            provider.calls
+        )
+        assert REPAIR_PROMPT_SUFFIX not in first_system
+        assert REPAIR_USER_SUFFIX not in first_user
+        assert first_temp is None
+        assert repair_system.endswith(REPAIR_PROMPT_SUFFIX)
+        assert repair_user.endswith(REPAIR_USER_SUFFIX)
+        assert repair_temp == 0.0
+
+    def test_requests_only_missing_entries(self):
+        provider = MockProvider(responses=[
+            json.dumps([{"index": 0, "text": "Hola"}]),
+            json.dumps([{"index": 1, "text": "Adiós"}]),
+        ])
+        texts = [{"index": 0, "text": "Hello"}, {"index": 1, "text": "Bye"}]
+        result = provider.translate(texts, "English", "Spanish")
+        assert [r["text"] for r in result] == ["Hola", "Adiós"]
+        follow_up = json.loads(provider.calls[1][1].split("Subtitle entries:", 1)[1])
+        assert follow_up == [{"index": 1, "text": "Bye"}]
+
+    def test_missing_entries_keep_source_after_retries(self):
+        partial = json.dumps([{"index": 0, "text": "Hola"}])
+        provider = MockProvider(responses=[partial, "[]"])
+        provider.retries = 2
+        texts = [{"index": 0, "text": "Hello"}, {"index": 1, "text": "Bye"}]
+        result = provider.translate(texts, "English", "Spanish")
+        assert [r["text"] for r in result] == ["Hola", "Bye"]
+
+    def test_renumbered_response_mapped_by_position(self):
+        response = json.dumps([{"index": 1, "text": "Hola"}, {"index": 2, "text": "Adiós"}])
+        provider = MockProvider(responses=[response])
+        texts = [{"index": 0, "text": "Hello"}, {"index": 1, "text": "Bye"}]
+        result = provider.translate(texts, "English", "Spanish")
+        assert result == [{"index": 0, "text": "Hola"}, {"index": 1, "text": "Adiós"}]
+
+
+class TestPassthrough:
+    def test_untranslatable_entries_not_sent(self):
+        provider = EchoProvider()
+        texts = [
+            {"index": 0, "text": "♪ ♪"},
+            {"index": 1, "text": "hello"},
+            {"index": 2, "text": "  "},
+            {"index": 3, "text": "- 123..."},
+        ]
+        result = provider.translate(texts, "English", "Spanish")
+        assert [r["text"] for r in result] == ["♪ ♪", "HELLO", "  ", "- 123..."]
+        assert provider.calls == 1
+
+    def test_all_untranslatable_skips_request(self):
+        provider = EchoProvider()
+        result = provider.translate([{"index": 0, "text": "..."}], "English", "Spanish")
+        assert result == [{"index": 0, "text": "..."}]
+        assert provider.calls == 0
+
+
+class TestTranslateMany:
+    @staticmethod
+    def _batches(n: int) -> list[list[dict]]:
+        return [[{"index": i, "text": f"line {i}"}] for i in range(n)]
+
+    def test_sequential_preserves_order(self):
+        provider = EchoProvider()
+        results = provider.translate_many(self._batches(3), "English", "Spanish")
+        assert [r[0]["text"] for r in results] == ["LINE 0", "LINE 1", "LINE 2"]
+
+    def test_concurrent_preserves_order(self):
+        provider = EchoProvider(delay=0.05)
+        done: list[int] = []
+        results = provider.translate_many(
+            self._batches(4), "English", "Spanish",
+            max_workers=4, on_result=lambda i, _: done.append(i),
+        )
+        assert [r[0]["index"] for r in results] == [0, 1, 2, 3]
+        assert sorted(done) == [0, 1, 2, 3]
+        assert provider.calls == 4
+
+    def test_requests_capped_at_concurrency(self):
+        provider = EchoProvider(delay=0.05)
+        provider.concurrency = 2
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+        call_api = provider._call_api
+
+        def tracking_call_api(*args):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            try:
+                return call_api(*args)
+            finally:
+                with lock:
+                    active -= 1
+
+        provider._call_api = tracking_call_api
+        provider.translate_many(self._batches(6), "English", "Spanish", max_workers=6)
+        assert peak == 2
+
+    def test_batches_pulled_lazily(self):
+        provider = EchoProvider()
+        pulled: list[int] = []
+
+        def batches():
+            for batch in self._batches(10):
+                pulled.append(batch[0]["index"])
+                yield batch
+
+        seen_at_first_result: list[int] = []
+        results = provider.translate_many(
+            batches(), "English", "Spanish", max_workers=2,
+            on_result=lambda i, _: seen_at_first_result.append(len(pulled)),
+        )
+        assert len(results) == 10
+        assert seen_at_first_result[0] <= 4
+
+    def test_cancel_before_start(self):
+        provider = EchoProvider()
+        cancel = threading.Event()
+        cancel.set()
+        with pytest.raises(KeyboardInterrupt):
+            provider.translate_many(
+                self._batches(2), "English", "Spanish", cancel_event=cancel,
+            )
+        assert provider.calls == 0
+
+    def test_failed_batch_stops_other_retries(self):
+        calls: list[str] = []
+        lock = threading.Lock()
+
+        def call_api(system_prompt, user_prompt, temperature=None):
+            with lock:
+                calls.append(user_prompt)
+            if "line 0" in user_prompt:
+                # Fail once the other batch's first request is under way
+                deadline = time.monotonic() + 2
+                while len(calls) < 2 and time.monotonic() < deadline:
+                    time.sleep(0.01)
+                raise RuntimeError("boom")
+            time.sleep(0.1)
+            return "not json"  # would be retried up to provider.retries times
+
+        provider = EchoProvider()
+        provider.concurrency = 2
+        provider._call_api = call_api
+        with pytest.raises(RuntimeError, match="boom"):
+            provider.translate_many(self._batches(2), "English", "Spanish", max_workers=2)
+        calls_at_raise = len(calls)
+        time.sleep(0.3)
+        assert len(calls) == calls_at_raise
+
+
+class TestCallApiInterruptible:
+    def test_reuses_worker_pool(self):
+        provider = EchoProvider()
+        cancel = threading.Event()
+        texts = [{"index": 0, "text": "hi"}]
+        provider.translate(texts, "English", "Spanish", cancel_event=cancel)
+        pool = provider._interrupt_pool
+        provider.translate(texts, "English", "Spanish", cancel_event=cancel)
+        assert pool is not None
+        assert provider._interrupt_pool is pool
+        provider.close()
+        assert provider._interrupt_pool is None
+
+    def test_session_reused_until_aborted(self):
+        provider = MockProvider()
+        session = provider._get_session()
+        assert provider._get_session() is session
+        provider._abort_active_request()
+        assert session.is_closed
+        assert provider._get_session() is not session
+        provider.close()
+
+    def test_skip_interrupts_slow_call(self):
+        provider = EchoProvider(delay=2.0)
+        skip = threading.Event()
+        threading.Timer(0.05, skip.set).start()
+        started = time.monotonic()
+        with pytest.raises(InterruptedError):
+            provider._call_api_interruptible(
+                "", 'Subtitle entries:[{"index":0,"text":"hi"}]', skip_event=skip,
+            )
+        assert time.monotonic() - started < 1.0
+        provider.close()
+
+
+class TestBuildPrompts:
+    def test_templates_read_once(self, tmp_path, monkeypatch):
+        from sublingo.providers import base
+
+        system_file = tmp_path / "system.txt"
+        system_file.write_text("Translate {source_lang} to {target_lang}", encoding="utf-8")
+        monkeypatch.setattr(base, "SYSTEM_PROMPT_FILE", system_file)
+        base._reload_templates()
+        try:
+            system, _ = base.build_prompts("English", "Spanish", "[]")
+            assert system == "Translate English to Spanish"
+
+            # Edits are not seen until the cache is reloaded
+            system_file.write_text("Now {target_lang}", encoding="utf-8")
+            assert base.build_prompts("English", "Spanish", "[]")[0] == system
+            base._reload_templates()
+            assert base.build_prompts("English", "Spanish", "[]")[0] == "Now Spanish"
+        finally:
+            base._reload_templates()
+
+    def test_entries_json_not_substituted(self):
+        from sublingo.providers.base import build_prompts
+
+        entries = '[{"index":0,"text":"{target_lang}"}]'
+        system, user = build_prompts("English", "Spanish", entries, tvdb_context="ctx")
+        assert user.rstrip().endswith(entries)
+        assert "Translate from English to Spanish." in user
+        assert "{tvdb_context}" not in user and "ctx" in user
+        assert build_prompts("English", "Spanish", "[]", tvdb_context="ctx")[0] is system
+
+    def test_placeholders_single_pass(self):
+        from sublingo.providers.base import _replace_placeholders
+
+        template = 'Use {a} and {b}; keep {"index": 1} and {unknown}'
+        result = _replace_placeholders(template, {"a": "{b}", "b": "B"})
+        assert result == 'Use {b} and B; keep {"index": 1} and {unknown}'
+
+
+class TestFormatEntries:
+    def test_compact(self):
+        from sublingo.providers.base import format_entries_for_prompt
+
+        entries = [{"index": 0, "text": "こんにちは"}]
+        assert format_entries_for_prompt(entries, compact=True) == '[{"index":0,"text":"こんにちは"}]'
+
+    def test_indented(self):
+        from sublingo.providers.base import format_entries_for_prompt
+
+        entries = [{"index": 0, "text": "Hi"}]
+        assert format_entries_for_prompt(entries, compact=False) == json.dumps(entries, indent=2)
+
+    def test_prompt_compact_unless_debug_flag(self, caplog):
+        response = json.dumps([{"index": 0, "text": "Hola"}])
+        texts = [{"index": 0, "text": "Hello"}]
+        # Verbose logging alone must not change what the model receives
+        caplog.set_level("DEBUG", logger="sublingo")
+        provider = MockProvider(responses=[response])
+        provider.translate(texts, "English", "Spanish")
+        assert '[{"index":0,"text":"Hello"}]' in provider.calls[0][1]
+
+        provider = MockProvider(responses=[response])
+        provider.debug = True
+        provider.translate(texts, "English", "Spanish")
+        assert json.dumps(texts, indent=2) in provider.calls[0][1]
+
+
+class TestOpenAIStreaming:
+    @staticmethod
+    def _provider(handler) -> OpenAIProvider:
+        provider = OpenAIProvider(api_key="test")
+        provider._session = httpx.Client(transport=httpx.MockTransport(handler))
+        return provider
+
+    def test_stops_after_array_closes(self):
+        def events():
+            for piece in ['[{"index": 0, ', '"text": "a]b"}', "]", "\nHope this helps!"]:
+                chunk = {"choices": [{"delta": {"content": piece}}]}
+                yield f"data: {json.dumps(chunk)}\n\n".encode()
+            raise AssertionError("stream read past the closing bracket")
+
+        def handler(request):
+            assert json.loads(request.content)["stream"] is True
+            return httpx.Response(
+                200, headers={"content-type": "text/event-stream"}, content=events(),
+            )
+
+        provider = self._provider(handler)
+        assert provider._call_api("sys", "user") == '[{"index": 0, "text": "a]b"}]'
+
+    def test_reads_past_bracketed_preface(self):
+        pieces = ["[Note] Names kept as-is.\n", '[{"index": 0, "text": "Hola"}]', "\nDone."]
+
+        def events():
+            for piece in pieces:
+                chunk = {"choices": [{"delta": {"content": piece}}]}
+                yield f"data: {json.dumps(chunk)}\n\n".encode()
+            raise AssertionError("stream read past the closing bracket")
+
+        def handler(request):
+            return httpx.Response(
+                200, headers={"content-type": "text/event-stream"}, content=events(),
+            )
+
+        raw = self._provider(handler)._call_api("sys", "user")
+        assert raw == "".join(pieces[:2])
+        assert extract_json_array(raw) == [{"index": 0, "text": "Hola"}]
+
+    def test_falls_back_to_json_body(self):
+        def handler(request):
+            return httpx.Response(200, json={"choices": [{"message": {"content": "[]"}}]})
+
+        assert self._provider(handler)._call_api("sys", "user") == "[]"
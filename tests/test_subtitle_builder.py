@@ -0,0 +1,50 @@
+"""Tests for writing subtitle files."""
+
+from pathlib import Path
+
+from sublingo.core.subtitle_builder import build_file, open_builder
+from sublingo.core.subtitle_parser import SubtitleEntry, parse_file
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def _entries(*texts: str) -> list[SubtitleEntry]:
+    return [
+        SubtitleEntry(index=i, start=i * 1000, end=(i + 1) * 1000, text=t)
+        for i, t in enumerate(texts)
+    ]
+
+
+def test_build_file_srt(tmp_path):
+    out = tmp_path / "out.srt"
+    build_file(_entries("Hola", "Adiós"), out)
+    assert [e.text for e in parse_file(out)] == ["Hola", "Adiós"]
+
+
+def test_build_file_bilingual(tmp_path):
+    out = tmp_path / "out.srt"
+    build_file(
+        _entries("Hola"), out, bilingual=True, original_entries=_entries("Hello"),
+    )
+    assert parse_file(out)[0].text == "Hello\nHola"
+
+
+def test_builder_incremental(tmp_path):
+    out = tmp_path / "out.ass"
+    with open_builder(out, original_path=FIXTURES / "sample.ass") as builder:
+        builder.add_entries(_entries("one"))
+        builder.add_entries(_entries("two"))
+        assert not out.exists()
+    assert [e.text for e in parse_file(out)] == ["one", "two"]
+    assert "[V4+ Styles]" in out.read_text(encoding="utf-8")
+
+
+def test_builder_not_written_on_error(tmp_path):
+    out = tmp_path / "out.srt"
+    try:
+        with open_builder(out) as builder:
+            builder.add_entries(_entries("one"))
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    assert not out.exists()
@@ -48,3 +48,34 @@ def test_entry_has_timing():
         assert entry.start < entry.end
         assert isinstance(entry.start, int)
         assert isinstance(entry.end, int)
+
+
+def test_srt_fast_path_matches_pysubs2():
+    import pysubs2
+
+    from sublingo.core.subtitle_parser import _entries_from_subs
+
+    path = FIXTURES / "sample.srt"
+    assert parse_file(path) == _entries_from_subs(pysubs2.load(str(path)))
+
+
+def test_parse_string_srt_strips_tags():
+    content = """\
+1
+00:00:01,000 --> 00:00:04,000 X1:100 X2:200
+<i>Hello</i> {\\an8}there
+
+2
+00:00:05.5 --> 00:00:08,000
+<font color="red">Second</font>
+line
+"""
+    entries = parse_string(content, format="srt")
+    assert [e.text for e in entries] == ["Hello there", "Second\nline"]
+    assert entries[1].start == 5500
+
+
+def test_srt_extension_with_vtt_content(tmp_path):
+    path = tmp_path / "mislabeled.srt"
+    path.write_text((FIXTURES / "sample.vtt").read_text(encoding="utf-8"), encoding="utf-8")
+    assert [e.text for e in parse_file(path)] == [e.text for e in parse_file(FIXTURES / "sample.vtt")]
@@ -0,0 +1,32 @@
+"""Tests for the persistent translation cache."""
+
+from sublingo.services.translation_cache import open_cache
+
+
+def test_round_trip_and_persistence(tmp_path):
+    context = ("openai", "gpt-4o-mini", "English", "Spanish", False)
+    cache = open_cache(tmp_path)
+    cache.put_many({"Hello": "Hola", "Bye": "Adiós"}, context)
+    assert cache.get_many(["Hello", "Bye", "Other"], context) == {"Hello": "Hola", "Bye": "Adiós"}
+    cache.close()
+
+    reopened = open_cache(tmp_path)
+    assert reopened.get_many(["Hello"], context) == {"Hello": "Hola"}
+    reopened.close()
+
+
+def test_context_separates_entries(tmp_path):
+    cache = open_cache(tmp_path)
+    cache.put_many({"Hello": "Hola"}, ("openai", "m", "English", "Spanish", False))
+    assert cache.get_many(["Hello"], ("openai", "m", "English", "French", False)) == {}
+    assert cache.get_many(["Hello"], ("openai", "m", "English", "Spanish", True)) == {}
+    cache.close()
+
+
+def test_many_keys(tmp_path):
+    context = ("p", "m", "a", "b", False)
+    cache = open_cache(tmp_path)
+    pairs = {f"line {i}": f"LINE {i}" for i in range(1200)}
+    cache.put_many(pairs, context)
+    assert cache.get_many(pairs, context) == pairs
+    cache.close()
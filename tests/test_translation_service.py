@@ -4,7 +4,15 @@ import json
 from pathlib import Path
 from unittest.mock import patch
 
-from sublingo.services.translation_service import PROVIDERS, get_provider, translate_file
+import pytest
+
+from sublingo.core.subtitle_parser import parse_file
+from sublingo.services.translation_service import (
+    PROVIDERS,
+    TranslationSkipped,
+    get_provider,
+    translate_file,
+)
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
@@ -53,7 +61,7 @@ def test_translate_file_e2e(tmp_path):
         mock_provider.name = "mock"
         mock_provider.model = "test"
         mock_provider._call_api_interruptible.return_value = lang_response
-        mock_provider.translate.return_value = [
+        translations = [[
             {"index": i, "text": t} for i, t in enumerate([
                 "こんにちは、お元気ですか？",
                 "元気です、ありがとう。",
@@ -61,7 +69,14 @@ def test_translate_file_e2e(tmp_path):
                 "散歩に行きませんか？",
                 "それはいい考えですね！",
             ])
-        ]
+        ]]
+
+        def fake_translate_many(batches, *args, on_result=None, **kwargs):
+            for i, _ in enumerate(batches):
+                on_result(i, translations[i])
+            return translations
+
+        mock_provider.translate_many.side_effect = fake_translate_many
 
         config = {
             "provider": "openai",
@@ -80,3 +95,80 @@ def test_translate_file_e2e(tmp_path):
         assert output.exists()
         content = output.read_text()
         assert "こんにちは" in content
+
+
+def test_translate_file_deduplicates_entries(tmp_path, mock_provider):
+    """Repeated lines are sent once and the translation is copied to each."""
+    source = tmp_path / "dupes.srt"
+    source.write_text(
+        "1\n00:00:01,000 --> 00:00:02,000\nHello\n\n"
+        "2\n00:00:03,000 --> 00:00:04,000\nBye\n\n"
+        "3\n00:00:05,000 --> 00:00:06,000\nHello \n",
+        encoding="utf-8",
+    )
+    config = {
+        "provider": "openai",
+        "target_language": "es",
+        "source_language": "en",
+        "batch_size": 20,
+    }
+    output = tmp_path / "out.srt"
+    translate_file(source, config, output_path=output)
+
+    assert [e["text"] for batch in mock_provider.sent for e in batch] == ["Hello", "Bye"]
+    entries = parse_file(output)
+    assert [e.text for e in entries] == ["HELLO", "BYE", "HELLO"]
+    assert entries[2].start == 5000
+
+
+def test_translate_file_uses_persistent_cache(tmp_path, mock_provider):
+    """A second run only sends lines the first run didn't translate."""
+    source = tmp_path / "in.srt"
+    source.write_text(
+        "1\n00:00:01,000 --> 00:00:02,000\nHello\n\n"
+        "2\n00:00:03,000 --> 00:00:04,000\nBye\n",
+        encoding="utf-8",
+    )
+    for run in range(2):
+        config = {
+            "provider": "openai",
+            "target_language": "es",
+            "source_language": "en",
+            "batch_size": 20,
+            "cache": True,
+            "cache_dir": str(tmp_path / "cache"),
+        }
+        translate_file(source, config, output_path=tmp_path / f"out{run}.srt")
+        config["_translation_cache"].close()
+
+    assert [e["text"] for batch in mock_provider.sent for e in batch] == ["Hello", "Bye"]
+    assert [e.text for e in parse_file(tmp_path / "out1.srt")] == ["HELLO", "BYE"]
+
+
+def _skip(batches, *args, skip_event=None, **kwargs):
+    skip_event.set()
+    raise InterruptedError
+
+
+def _fail(batches, *args, **kwargs):
+    raise RuntimeError("boom")
+
+
+@pytest.mark.parametrize(
+    "translate_many, expected",
+    [(None, None), (_skip, TranslationSkipped), (_fail, RuntimeError)],
+    ids=["success", "skip", "error"],
+)
+def test_translate_file_closes_provider(tmp_path, mock_provider, translate_many, expected):
+    """The provider's session and pools are released however the file ends."""
+    if translate_many is not None:
+        mock_provider.translate_many.side_effect = translate_many
+    config = {"provider": "openai", "target_language": "es", "source_language": "en"}
+    output = tmp_path / "out.srt"
+    if expected is None:
+        translate_file(FIXTURES / "sample.srt", config, output_path=output)
+    else:
+        with pytest.raises(expected):
+            translate_file(FIXTURES / "sample.srt", config, output_path=output)
+
+    mock_provider.close.assert_called_once()
@@ -0,0 +1,170 @@
+"""Tests for the TVDB API client."""
+
+import threading
+
+import httpx
+
+from sublingo.services.tvdb_cache import open_tvdb_cache
+from sublingo.services.tvdb_client import TVDB_BASE_URL, TVDBClient
+
+
+def _client(handler, cache=None) -> TVDBClient:
+    client = TVDBClient("key", cache=cache)
+    client._client = httpx.Client(
+        base_url=TVDB_BASE_URL, transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+def test_logs_in_once_and_reuses_token():
+    seen: list[tuple[str, str | None]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.url.path, request.headers.get("Authorization")))
+        if request.url.path.endswith("/login"):
+            return httpx.Response(200, json={"data": {"token": "tok"}})
+        return httpx.Response(200, json={"data": [{"tvdb_id": "42"}]})
+
+    client = _client(handler)
+    assert client.search_series("South Park") == 42
+    assert client.search_series("Friends") == 42
+    assert seen == [
+        ("/v4/login", None),
+        ("/v4/search", "Bearer tok"),
+        ("/v4/search", "Bearer tok"),
+    ]
+    client.close()
+
+
+def test_missing_translation_returns_none():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/login"):
+            return httpx.Response(200, json={"data": {"token": "tok"}})
+        return httpx.Response(404)
+
+    client = _client(handler)
+    assert client.get_series_translation(1, "spa") is None
+    client.close()
+
+
+def test_concurrent_calls_log_in_once():
+    logins: list[int] = []
+    barrier = threading.Barrier(4)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/login"):
+            logins.append(1)
+            return httpx.Response(200, json={"data": {"token": "tok"}})
+        return httpx.Response(200, json={"data": {"name": "n", "overview": "o"}})
+
+    client = _client(handler)
+
+    def fetch():
+        barrier.wait()
+        client.get_series_translation(1, "eng")
+
+    threads = [threading.Thread(target=fetch) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(logins) == 1
+    client.close()
+
+
+def test_translations_from_one_extended_request():
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/login"):
+            return httpx.Response(200, json={"data": {"token": "tok"}})
+        calls.append(request.url.path)
+        assert request.url.params["meta"] == "translations"
+        if "/episodes/" in request.url.path:
+            return httpx.Response(404)
+        translations = {
+            "nameTranslations": [
+                {"language": "eng", "name": "Show"},
+                {"language": "spa", "name": "Serie"},
+            ],
+            "overviewTranslations": [{"language": "eng", "overview": "About"}],
+        }
+        return httpx.Response(200, json={"data": {"translations": translations}})
+
+    client = _client(handler)
+    assert client.get_series_translation(1, "spa") == {"name": "Serie", "overview": ""}
+    assert client.get_series_translation(1, "eng") == {"name": "Show", "overview": "About"}
+    assert client.get_series_translation(1, "fra") is None
+    assert client.get_episode_translation(5, "spa") is None
+    assert client.get_episode_translation(5, "eng") is None
+    assert calls == ["/v4/series/1/extended", "/v4/episodes/5/extended"]
+    client.close()
+
+
+def test_season_episode_ids_fetched_once():
+    calls: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/login"):
+            return httpx.Response(200, json={"data": {"token": "tok"}})
+        params = dict(request.url.params)
+        calls.append(params)
+        page = int(params["page"])
+        episodes = [
+            {"id": 100 + n, "seasonNumber": 1, "number": n}
+            for n in ((1, 2) if page == 0 else (3,))
+        ]
+        links = {"next": "more" if page == 0 else None}
+        return httpx.Response(200, json={"data": {"episodes": episodes}, "links": links})
+
+    client = _client(handler)
+    assert client.get_episode_id(7, 1, 3) == 103
+    assert client.get_episode_id(7, 1, 1) == 101
+    assert client.get_episode_id(7, 1, 9) is None
+    assert [c["page"] for c in calls] == ["0", "1"]
+    client.close()
+
+
+def test_disk_cache_serves_later_runs(tmp_path):
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if request.url.path.endswith("/login"):
+            return httpx.Response(200, json={"data": {"token": "tok"}})
+        if request.url.path.endswith("/search"):
+            return httpx.Response(200, json={"data": [{"tvdb_id": "42"}]})
+        if request.url.path.endswith("/episodes/default"):
+            episodes = [{"id": 101, "seasonNumber": 1, "number": 1}]
+            return httpx.Response(200, json={"data": {"episodes": episodes}, "links": {}})
+        translations = {"nameTranslations": [{"language": "spa", "name": "Serie"}]}
+        return httpx.Response(200, json={"data": {"translations": translations}})
+
+    def lookup(cache):
+        client = _client(handler, cache=cache)
+        result = (
+            client.search_series("Show"),
+            client.get_episode_id(42, 1, 1),
+            client.get_series_translation(42, "spa"),
+        )
+        client.close()
+        return result
+
+    cache = open_tvdb_cache(tmp_path)
+    first = lookup(cache)
+    first_calls = len(calls)
+    cache.close()
+
+    cache = open_tvdb_cache(tmp_path)
+    assert lookup(cache) == first == (42, 101, {"name": "Serie", "overview": ""})
+    assert len(calls) == first_calls
+    cache.close()
+
+
+def test_disk_cache_entries_expire(tmp_path):
+    cache = open_tvdb_cache(tmp_path)
+    cache.put("search:Show", {"id": 1})
+    assert cache.get("search:Show") == {"id": 1}
+    cache.ttl = -1
+    assert cache.get("search:Show") is None
+    cache.close()
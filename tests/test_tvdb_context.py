@@ -1,8 +1,16 @@
 """Tests for TVDB context filename parsing."""
 
+from collections import OrderedDict
+
 import pytest
 
-from sublingo.services.tvdb_context import parse_series_info, resolve_tvdb_language
+from sublingo.services import tvdb_context
+from sublingo.services.tvdb_context import (
+    _google_translate_dicts,
+    build_tvdb_context,
+    parse_series_info,
+    resolve_tvdb_language,
+)
 
 
 class TestParseSeriesInfo:
@@ -67,3 +75,72 @@ class TestResolveTvdbLanguage:
 
     def test_unknown_code(self):
         assert resolve_tvdb_language("xx-YY") is None
+
+
+class FakeTVDBClient:
+    """Stand-in TVDBClient returning canned translations."""
+
+    def search_series(self, name):
+        return 1
+
+    def get_episode_id(self, series_id, season, episode):
+        return 10
+
+    def get_series_translation(self, series_id, lang):
+        return {"name": f"Show-{lang}", "overview": ""}
+
+    def get_episode_translation(self, episode_id, lang):
+        return {"name": f"Ep-{lang}", "overview": ""} if lang == "jpn" else None
+
+
+class TestBuildTvdbContext:
+    def test_lines_in_language_order(self):
+        context = build_tvdb_context(FakeTVDBClient(), "Show - S01E02.srt", "ja", "en")
+        assert context.splitlines()[1:] == [
+            "Series title (source: ja): Show-jpn",
+            "Episode title (source: ja, S01E02): Ep-jpn",
+            "Series title (target: en): Show-eng",
+        ]
+
+
+class TestGoogleTranslateFallback:
+    def test_memoized_per_text(self, monkeypatch):
+        calls: list[list[str]] = []
+
+        async def fake_translate_all(texts, dest):
+            calls.append(texts)
+            return [f"{dest}:{t}" for t in texts]
+
+        monkeypatch.setattr(tvdb_context, "_google_translate_all", fake_translate_all)
+        monkeypatch.setattr(tvdb_context, "_google_cache", OrderedDict())
+        data = {"name": "Show", "overview": "About"}
+        expected = {"name": "zh-tw:Show", "overview": "zh-tw:About"}
+        assert _google_translate_dicts([data], "zh-tw") == [expected]
+        assert _google_translate_dicts([data], "zh-tw") == [expected]
+        assert _google_translate_dicts(
+            [{"name": "Show", "overview": ""}, {"name": "Ep", "overview": "About"}], "zh-tw",
+        ) == [
+            {"name": "zh-tw:Show", "overview": ""},
+            {"name": "zh-tw:Ep", "overview": "zh-tw:About"},
+        ]
+        assert calls == [["Show", "About"], ["Ep"]]
+
+    def test_one_batch_per_language(self, monkeypatch):
+        calls: list[tuple[list[str], str]] = []
+
+        async def fake_translate_all(texts, dest):
+            calls.append((texts, dest))
+            return [f"{dest}:{t}" for t in texts]
+
+        class EnglishOnlyClient(FakeTVDBClient):
+            def get_series_translation(self, series_id, lang):
+                return {"name": "Show", "overview": "About"} if lang == "eng" else None
+
+            def get_episode_translation(self, episode_id, lang):
+                return {"name": "Pilot", "overview": ""} if lang == "eng" else None
+
+        monkeypatch.setattr(tvdb_context, "_google_translate_all", fake_translate_all)
+        monkeypatch.setattr(tvdb_context, "_google_cache", OrderedDict())
+        context = build_tvdb_context(EnglishOnlyClient(), "Show - S01E02.srt", "en", "ja")
+        assert calls == [(["Show", "About", "Pilot"], "ja")]
+        assert "Episode title (target: ja, S01E02): ja:Pilot" in context.splitlines()